@@ -158,9 +158,11 @@ def english_to_skeleton(english_text: str, cldr_path: str, english_df=None, engl
     else:
         # If using cached values, make sure they're already cleaned (they should be)
         pass
+    # Hashed view of the reference values for the membership checks below
+    english_value_set = set(english_values)
     
     # First try exact matches
-    confirmed = [opt for opt in expanded_options if opt in english_values or len(set(opt.lower())) == 1]
+    confirmed = [opt for opt in expanded_options if opt in english_value_set or len(set(opt.lower())) == 1]
     
     # If no exact matches, try to find the best approximation
     if not confirmed:
@@ -169,9 +171,9 @@ def english_to_skeleton(english_text: str, cldr_path: str, english_df=None, engl
         if 'MM/y' in expanded_options:
             confirmed = ['MM/y']
         # Then check for other patterns
-        elif any(opt in ['dd/y'] for opt in expanded_options) and 'M/y' in english_values:
+        elif any(opt in ['dd/y'] for opt in expanded_options) and 'M/y' in english_value_set:
             confirmed = ['M/y']
-        elif any(opt in ['MMM y', 'MMMM y'] for opt in expanded_options) and 'M/y' in english_values:
+        elif any(opt in ['MMM y', 'MMMM y'] for opt in expanded_options) and 'M/y' in english_value_set:
             confirmed = ['M/y']
         # Handle range expressions that might not have exact CLDR matches
         else:
@@ -7,6 +7,7 @@ statistics and reports on the results.
 """
 
 import csv
+import functools
 import os
 import re
 import pandas as pd
@@ -23,6 +24,33 @@ from ..core.skeleton_analyzer import (
 from ..core.constants import ENGLISH_DATE_DICT
 
 
+@functools.lru_cache(maxsize=4096)
+def _process_english(english_text: str) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    Tokenize an English expression and pick its skeleton.
+    
+    The English side does not depend on the target language, and batch inputs
+    repeat the same English text across many rows, so results are memoized.
+    
+    Args:
+        english_text (str): English date expression
+        
+    Returns:
+        tuple: (english_tokens, english_skeleton), with english_skeleton None
+        if no skeleton could be generated
+    """
+    english_tokens = tokenize_date_expression(english_text)
+    english_formatting_options = analyze_tokens_for_format_options(english_tokens, ENGLISH_DATE_DICT)
+    english_options = generate_valid_combinations(english_formatting_options)
+    english_skeleton_options = convert_to_skeleton_codes(english_options)
+    english_skeleton_strings = format_skeleton_strings(english_skeleton_options)
+    
+    # Use first English skeleton (most common)
+    english_skeleton = english_skeleton_strings[0] if english_skeleton_strings else None
+    
+    return tuple(english_tokens), english_skeleton
+
+
 class BatchProcessor:
     """
     Handles batch processing of date pairs from CSV files.
@@ -114,18 +142,11 @@ class BatchProcessor:
         """
         try:
             # Process English expression
-            english_tokens = tokenize_date_expression(english_text)
-            english_formatting_options = analyze_tokens_for_format_options(english_tokens, ENGLISH_DATE_DICT)
-            english_options = generate_valid_combinations(english_formatting_options)
-            english_skeleton_options = convert_to_skeleton_codes(english_options)
-            english_skeleton_strings = format_skeleton_strings(english_skeleton_options)
+            english_tokens, english_skeleton = _process_english(english_text)
             
-            if not english_skeleton_strings:
+            if english_skeleton is None:
                 return None, None
             
-            # Use first English skeleton (most common)
-            english_skeleton = english_skeleton_strings[0]
-            
             # Process target expression
             target_tokens = semantic_tokenize(target_text, self.target_date_dict, self.target_lexicon)
             
@@ -202,9 +223,10 @@ class BatchProcessor:
              open(output_file, 'w', encoding='utf-8', newline='') as outfile:
             
             reader = csv.DictReader(infile)
-            writer = csv.DictWriter(outfile, fieldnames=['ENGLISH_SKELETON', 'TARGET_SKELETON', 'XPATH'])
+            # Rows are written as plain sequences; the open handle buffers them
+            writer = csv.writer(outfile)
             
-            writer.writeheader()
+            writer.writerow(['ENGLISH_SKELETON', 'TARGET_SKELETON', 'XPATH'])
             
             for row_num, row in enumerate(reader, 1):
                 english_text = row.get('ENGLISH', '').strip()
@@ -223,11 +245,7 @@ class BatchProcessor:
                     failed_rows += 1
                     continue
                 
-                writer.writerow({
-                    'ENGLISH_SKELETON': english_skeleton,
-                    'TARGET_SKELETON': target_skeleton or '',
-                    'XPATH': xpath
-                })
+                writer.writerow((english_skeleton, target_skeleton or '', xpath))
                 
                 processed_rows += 1
                 
@@ -7,6 +7,7 @@ and provides accuracy metrics and detailed analysis.
 """
 
 import csv
+from collections import Counter
 import pandas as pd
 from typing import Dict, List, Tuple, Any
 from pathlib import Path
@@ -83,10 +84,15 @@ class SkeletonValidator:
         max_similarity = 0.0
         best_match = None
         
+        # Character counts of each generated option and character sets of each
+        # verified option, computed once rather than per option pair
+        verified_char_sets = [(verified_opt, frozenset(verified_opt)) for verified_opt in verified_options]
+        
         for gen_opt in generated_options:
-            for verified_opt in verified_options:
+            gen_char_counts = Counter(gen_opt)
+            for verified_opt, verified_chars in verified_char_sets:
                 # Simple similarity: count matching characters
-                common_chars = sum(1 for c in gen_opt if c in verified_opt)
+                common_chars = sum(count for c, count in gen_char_counts.items() if c in verified_chars)
                 total_chars = max(len(gen_opt), len(verified_opt))
                 similarity = common_chars / total_chars if total_chars > 0 else 0.0
                 
@@ -124,18 +130,24 @@ class SkeletonValidator:
         target_correct = 0
         total_rows = len(self.results_data)
         
-        for idx, row in self.results_data.iterrows():
+        # Index the verified entries by XPATH once, keeping the first entry for
+        # each XPATH, instead of masking the whole verified table for every row
+        verified_by_xpath = {}
+        for verified_entry in self.verified_data.to_dict('records'):
+            verified_xpath = verified_entry['XPATH']
+            if not pd.isna(verified_xpath):
+                verified_by_xpath.setdefault(verified_xpath, verified_entry)
+        
+        for idx, row in zip(self.results_data.index, self.results_data.to_dict('records')):
             xpath = row.get('XPATH', '')
             
             # Find corresponding verified entry by XPATH
-            verified_row = self.verified_data[self.verified_data['XPATH'] == xpath]
+            verified_row = verified_by_xpath.get(xpath) if not pd.isna(xpath) else None
             
-            if len(verified_row) == 0:
+            if verified_row is None:
                 print(f"Warning: No verified entry found for XPATH: {xpath}")
                 continue
             
-            verified_row = verified_row.iloc[0]
-            
             # Compare English skeletons
             english_comparison = self.compare_skeletons(
                 row.get('ENGLISH_SKELETON', ''),
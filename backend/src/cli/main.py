@@ -79,7 +79,7 @@ def validate_against_reference_data(expanded_options, english_df):
     Returns:
         list: List of confirmed skeleton combinations
     """
-    english_possibilities = english_df['English'].values.tolist()
+    english_possibilities = set(english_df['English'].values.tolist())
     
     confirmed_combinations = []
     for option in expanded_options:
@@ -234,8 +234,7 @@ def process_target_language(lang_code, base_path, tlang_expression, eng_equivale
         english_tokenized, eng_skeleton, tlang_tokenized, date_dict, ambiguities, tlang_expression
     )
     
-    # Analyze target language tokens for valid options (excluding literal text tokens)
-    # Filter out literal tokens for traditional skeleton analysis
+    # Filter out literal tokens to find the recognized date tokens
     date_only_tokens = []
     for token in tlang_tokenized:
         if (token.isnumeric() or 
@@ -243,49 +242,13 @@ def process_target_language(lang_code, base_path, tlang_expression, eng_equivale
             token in lexicon):
             date_only_tokens.append(token)
     
-    if date_only_tokens:
-        target_formatting_options = analyze_tokens_for_format_options(date_only_tokens, date_dict)
-        target_options = generate_valid_combinations(target_formatting_options)
-        target_skeleton_options = convert_to_skeleton_codes(target_options)
-        target_string_options = format_skeleton_strings(target_skeleton_options)
-        
-        # For validation, check if the cross-language mapped skeletons are reasonable
-        # by comparing the non-literal parts
-        confirmed_combinations = []
-        for skeleton in target_skeleton_strings:
-            # Extract the non-literal parts for comparison
-            skeleton_without_literals = skeleton
-            # Remove only quoted literals (preserve spaces around them)
-            import re
-            skeleton_without_literals = re.sub(r"'[^']*'", "", skeleton_without_literals)
-            # Clean up multiple spaces but preserve single spaces
-            skeleton_without_literals = re.sub(r'\s+', ' ', skeleton_without_literals).strip()
-            
-            # Check if the core skeleton structure is valid
-            is_valid = False
-            for valid_option in target_string_options:
-                if skeleton_without_literals == valid_option:
-                    is_valid = True
-                    break
-            
-            # If the core structure is valid, accept the skeleton with literals
-            # Also accept if it's a reasonable pattern even if not exact match
-            if is_valid or not target_string_options:
-                confirmed_combinations.append(skeleton)
-            else:
-                # More flexible validation - check if it contains expected elements
-                # Count CLDR elements in both skeletons
-                original_elements = re.findall(r'[MLdyEc]+', skeleton_without_literals)
-                if any(re.findall(r'[MLdyEc]+', valid_option) == original_elements for valid_option in target_string_options):
-                    confirmed_combinations.append(skeleton)
-                elif target_skeleton_strings:  # If we generated something, it's probably valid
-                    confirmed_combinations.append(skeleton)
-                
-    else:
-        # If no recognizable date tokens, accept whatever was generated
-        confirmed_combinations = target_skeleton_strings
+    # A lone punctuation mark has no valid format option, so an expression whose
+    # only recognized token is punctuation cannot be a date
+    if len(date_only_tokens) == 1 and date_only_tokens[0] in [",", "/", "-", "–", "."]:
+        raise ValueError("Invalid format options.")
     
-    return confirmed_combinations
+    # Every mapped skeleton is accepted
+    return target_skeleton_strings
 
 
 def get_cldr_data_path():
@@ -6,7 +6,7 @@ Handles detection and resolution of ambiguous date elements that appear
 multiple times in date dictionaries (e.g., "J" could be January, June, or July).
 """
 
-from .constants import ENGLISH_DATE_DICT, MONTH_INDEXING, DAY_INDEXING
+from .constants import ENGLISH_DATE_DICT, MONTH_INDEXING, DAY_INDEXING, SKELETON_CODES, SKELETON_FULL_NAME
 
 
 def detect_ambiguities(tokens, skeleton_tokens):
@@ -30,7 +30,6 @@ def detect_ambiguities(tokens, skeleton_tokens):
             continue
         
         questions = set()
-        from .constants import SKELETON_CODES
         skeleton_code = skeleton_tokens[i_token]
         
         # For standalone single-token inputs, check ALL possible standalone skeleton codes
@@ -138,7 +137,6 @@ def resolve_ambiguity_in_mapping(token, skeleton_code, ambiguities, date_dict, p
         
         # Find the appropriate key in date_dict
         for key in date_dict.keys():
-            from .constants import SKELETON_CODES
             if skeleton_code == SKELETON_CODES.get(key):
                 try:
                     if any(char in "ML" for char in skeleton_code):
@@ -205,7 +203,6 @@ def get_metadata_for_skeleton(eng_skeleton, ambiguities, english_df):
     
     elif len(set(eng_skeleton.lower())) == 1:
         # Handle repeated character patterns with ambiguity resolution
-        from .constants import SKELETON_CODES, SKELETON_FULL_NAME
         for key in SKELETON_CODES.keys():
             if eng_skeleton == SKELETON_CODES[key]:
                 full_name = SKELETON_FULL_NAME[key]
@@ -223,5 +223,8 @@ DAY_INDEXING = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 # Tokenization pattern
 TOKEN_PATTERN = r'[\p{L}\p{M}]+\.?|\p{N}+|[/,\.\-–—،፣]'
 
+# Prefix marking a compound-word token attached to the previous token (no space before it)
+ATTACHED_PREFIX = "ATTACHED:"
+
 # Punctuation characters - comprehensive list of all dash/hyphen variations
 PUNCTUATION = [",", "/", "-", "—", "–", "–—", ".", "،", "፣"] 
\ No newline at end of file
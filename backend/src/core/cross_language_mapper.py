@@ -8,12 +8,118 @@ equivalents, including fuzzy numeric matching, permutation testing, and
 ambiguity resolution during cross-language conversion.
 """
 
+import functools
+import re
+from collections import Counter, defaultdict
 from itertools import permutations, product
+from types import MappingProxyType
 import regex
-from collections import Counter
-from .constants import ENGLISH_DATE_DICT, MONTH_INDEXING, DAY_INDEXING, TOKEN_PATTERN, SKELETON_CODES
+from .constants import ENGLISH_DATE_DICT, MONTH_INDEXING, DAY_INDEXING, TOKEN_PATTERN, SKELETON_CODES, ATTACHED_PREFIX
 
+# Precompiled patterns shared by the mapping helpers
+_TOKEN_RE = regex.compile(TOKEN_PATTERN)
+# TOKEN_PATTERN restricted to ASCII input, where the Unicode property classes
+# reduce to plain ranges and the stdlib engine is faster
+_ASCII_TOKEN_RE = re.compile(r'[A-Za-z]+\.?|[0-9]+|[/,.\-]')
+_SKELETON_SPLIT_RE = regex.compile(r'[,\.\-–—\s]+')
+_SKELETON_CODE_RE = re.compile(r'[M]{1,4}|[d]{1,2}|[y]{1,2}|[E]{1,6}|[L]{1,5}|[c]{1,6}')
 
+# First (category, index) of each English date word, lowercased, in
+# ENGLISH_DATE_DICT order; its keys double as the merged set of English date words
+_ENGLISH_ELEMENT_POSITIONS = {}
+for _key, _items in ENGLISH_DATE_DICT.items():
+    for _idx, _item in enumerate(_items):
+        _ENGLISH_ELEMENT_POSITIONS.setdefault(_item.lower(), (_key, _idx))
+
+# Separators that mark a range skeleton, in the priority used to split it
+_RANGE_SKELETON_SEPARATORS = (' - ', '–', '—')
+
+# Skeleton element types compared by has_consistent_formatting
+_ELEMENT_TYPES = frozenset('MdyELc')
+
+# Numeric date separators, checked in priority order by _detect_separator
+_DATE_SEPARATORS = frozenset(("/", ".", "-", "–"))
+
+# Skeleton format options for a numeric target value, keyed by
+# (digit count, zero-padded, component letter); missing keys have no options
+_NUMERIC_FORMAT_OPTIONS = {
+    (1, False, 'M'): ('M',), (1, True, 'M'): ('M',),
+    (2, False, 'M'): ('M', 'MM'), (2, True, 'M'): ('MM',),
+    (1, False, 'd'): ('d',), (1, True, 'd'): ('d',),
+    (2, False, 'd'): ('d', 'dd'), (2, True, 'd'): ('dd',),
+    (2, False, 'y'): ('yy',), (2, True, 'y'): ('yy',),
+    (4, False, 'y'): ('y',), (4, True, 'y'): ('y',),
+}
+
+
+def _tokenize(text):
+    """
+    Tokenize text with TOKEN_PATTERN, using the stdlib engine for ASCII input.
+    
+    Args:
+        text (str): Text to tokenize
+        
+    Returns:
+        list: List of tokens
+    """
+    if text.isascii():
+        return _ASCII_TOKEN_RE.findall(text)
+    return _TOKEN_RE.findall(text)
+
+
+def _most_common_length(lengths):
+    """
+    Return the most frequent length, preferring the earliest seen on ties (0 if empty).
+    
+    Args:
+        lengths (list): Element lengths
+        
+    Returns:
+        int: Most frequent length
+    """
+    counts = {}
+    for length in lengths:
+        counts[length] = counts.get(length, 0) + 1
+    
+    most_common, most_common_count = 0, 0
+    for length, count in counts.items():
+        if count > most_common_count:
+            most_common, most_common_count = length, count
+    return most_common
+
+
+@functools.lru_cache(maxsize=1024)
+def _skeleton_element_groups(skeleton):
+    """
+    Extract a skeleton's codes and group them by element type.
+    
+    Range checks pair every left-side option with every right-side option, so
+    each side is memoized on its own rather than only per (left, right) pair.
+    
+    Args:
+        skeleton (str): One side of a range skeleton (e.g., "MMM d, y")
+        
+    Returns:
+        MappingProxyType: Element type letter -> tuple of codes of that type, in
+        order (read-only, as the result is shared between cached calls)
+    """
+    # Split on common separators and extract skeleton codes
+    elements = []
+    for part in _SKELETON_SPLIT_RE.split(skeleton):
+        part = part.strip()
+        if part:
+            # Extract skeleton codes (M, MM, MMM, MMMM, d, dd, y, yy, E, EEE, etc.)
+            elements.extend(_SKELETON_CODE_RE.findall(part))
+    
+    groups = {}
+    for elem in elements:
+        # Every element type is identified by its first letter
+        if elem[:1] in _ELEMENT_TYPES:
+            groups.setdefault(elem[0], []).append(elem)
+    return MappingProxyType({elem_type: tuple(codes) for elem_type, codes in groups.items()})
+
+
+@functools.lru_cache(maxsize=4096)
 def has_consistent_formatting(left_skeleton: str, right_skeleton: str) -> bool:
     """
     Check if two skeleton parts have consistent formatting (same number of M's, d's, y's, etc.).
@@ -25,47 +131,14 @@ def has_consistent_formatting(left_skeleton: str, right_skeleton: str) -> bool:
     Returns:
         bool: True if formatting is consistent, False otherwise
     """
-    # Extract skeleton elements from both sides
-    def extract_elements(skeleton):
-        # Split on common separators and extract skeleton codes
-        parts = regex.split(r'[,\.\-–—\s]+', skeleton)
-        elements = []
-        for part in parts:
-            part = part.strip()
-            if part:
-                # Extract skeleton codes (M, MM, MMM, MMMM, d, dd, y, yy, E, EEE, etc.)
-                codes = regex.findall(r'[M]{1,4}|[d]{1,2}|[y]{1,2}|[E]{1,6}|[L]{1,5}|[c]{1,6}', part)
-                elements.extend(codes)
-        return elements
-    
-    left_elements = extract_elements(left_skeleton)
-    right_elements = extract_elements(right_skeleton)
-    
-    # Group elements by type
-    def group_by_type(elements):
-        groups = {}
-        for elem in elements:
-            if elem.startswith('M'):
-                groups['M'] = groups.get('M', []) + [elem]
-            elif elem.startswith('d'):
-                groups['d'] = groups.get('d', []) + [elem]
-            elif elem.startswith('y'):
-                groups['y'] = groups.get('y', []) + [elem]
-            elif elem.startswith('E'):
-                groups['E'] = groups.get('E', []) + [elem]
-            elif elem.startswith('L'):
-                groups['L'] = groups.get('L', []) + [elem]
-            elif elem.startswith('c'):
-                groups['c'] = groups.get('c', []) + [elem]
-        return groups
-    
-    left_groups = group_by_type(left_elements)
-    right_groups = group_by_type(right_elements)
+    # Group elements by type on both sides
+    left_groups = _skeleton_element_groups(left_skeleton)
+    right_groups = _skeleton_element_groups(right_skeleton)
     
     # Check consistency for each element type
     for elem_type in ['M', 'd', 'y', 'E', 'L', 'c']:
-        left_elems = left_groups.get(elem_type, [])
-        right_elems = right_groups.get(elem_type, [])
+        left_elems = left_groups.get(elem_type, ())
+        right_elems = right_groups.get(elem_type, ())
         
         # If both sides have this element type, check consistency
         if left_elems and right_elems:
@@ -74,8 +147,8 @@ def has_consistent_formatting(left_skeleton: str, right_skeleton: str) -> bool:
             right_lengths = [len(elem) for elem in right_elems]
             
             # Use the most frequent length for each side
-            left_most_common = Counter(left_lengths).most_common(1)[0][0] if left_lengths else 0
-            right_most_common = Counter(right_lengths).most_common(1)[0][0] if right_lengths else 0
+            left_most_common = _most_common_length(left_lengths)
+            right_most_common = _most_common_length(right_lengths)
             
             # If lengths don't match, this combination is inconsistent
             if left_most_common != right_most_common:
@@ -95,11 +168,8 @@ def validate_english_date_values(english_tokens, english_skeleton):
     Raises:
         ValueError: If month > 12 or day > 31
     """
-    import regex
-    
     # Tokenize skeleton and expression
-    pattern = r'[\p{L}\p{M}]+\.?|\p{N}+|[/,\.\-–—،፣]'
-    skeleton_tokens = regex.findall(pattern, english_skeleton)
+    skeleton_tokens = _tokenize(english_skeleton)
 
     # Helper to extract only date element codes from a skeleton token list
     def extract_element_codes(tokens_list):
@@ -113,19 +183,14 @@ def validate_english_date_values(english_tokens, english_skeleton):
         # Split skeleton and tokens into sides and validate side-by-side
         sk_parts = english_skeleton.replace('–','-').split('-')
         # Split english_tokens by dash occurrence
-        if '-' in english_tokens:
-            dash_idx = english_tokens.index('-')
-        elif '–' in english_tokens:
-            dash_idx = english_tokens.index('–')
-        else:
-            dash_idx = -1
+        dash_idx, _ = _find_range_dash(english_tokens)
 
         if len(sk_parts) == 2 and dash_idx != -1:
             left_tokens = english_tokens[:dash_idx]
             right_tokens = english_tokens[dash_idx+1:]
 
-            left_codes = extract_element_codes(regex.findall(pattern, sk_parts[0]))
-            right_codes = extract_element_codes(regex.findall(pattern, sk_parts[1]))
+            left_codes = extract_element_codes(_tokenize(sk_parts[0]))
+            right_codes = extract_element_codes(_tokenize(sk_parts[1]))
 
             for side_idx, (vals, codes) in enumerate(((extract_numeric_values(left_tokens), left_codes),
                                                       (extract_numeric_values(right_tokens), right_codes)), start=1):
@@ -166,11 +231,8 @@ def generate_month_day_permutations(numeric_tokens, english_skeleton, english_to
     Returns:
         list: List of skeleton code permutations
     """
-    import regex
-    
     # Tokenize English skeleton to get the pattern
-    pattern = r'[\p{L}\p{M}]+\.?|\p{N}+|[/,\.\-–—،፣]'
-    skeleton_tokens = regex.findall(pattern, english_skeleton)
+    skeleton_tokens = _tokenize(english_skeleton)
     
     # Extract numeric skeleton elements (M, d, y, etc.)
     skeleton_elements = [token for token in skeleton_tokens if token in ['M', 'MM', 'd', 'dd', 'y', 'yy']]
@@ -186,15 +248,10 @@ def generate_month_day_permutations(numeric_tokens, english_skeleton, english_to
     # Map each target numeric token to its corresponding English skeleton element
     target_to_skeleton_mapping = []
     for token, value in numeric_tokens:
-        # Find which English numeric token this target token corresponds to
-        corresponding_english_token = None
-        for eng_token in english_numeric_to_skeleton:
-            if eng_token == token:  # Exact match
-                corresponding_english_token = eng_token
-                break
+        # Find which English numeric token this target token corresponds to (exact match)
+        skeleton_element = english_numeric_to_skeleton.get(token)
         
-        if corresponding_english_token:
-            skeleton_element = english_numeric_to_skeleton[corresponding_english_token]
+        if skeleton_element:
             target_to_skeleton_mapping.append((token, value, skeleton_element))
         else:
             # No direct match found - this might be a reordering case
@@ -240,21 +297,274 @@ def generate_month_day_permutations(numeric_tokens, english_skeleton, english_to
         return codes
     
     # Generate all combinations of skeleton codes
-    from itertools import product
-    
-    all_code_combinations = []
-    for token, value, skeleton_element in target_to_skeleton_mapping:
-        codes = get_skeleton_codes_for_element(token, value, skeleton_element)
-        all_code_combinations.append(codes)
+    all_code_combinations = [
+        get_skeleton_codes_for_element(token, value, skeleton_element)
+        for token, value, skeleton_element in target_to_skeleton_mapping
+    ]
     
-    # Generate all valid combinations
-    permutations = []
-    for combination in product(*all_code_combinations):
-        permutations.append(list(combination))
+    # Generate all valid combinations. Repeated element types are legitimate
+    # here (e.g., M and d appear on both sides of "M/d – M/d"), so nothing is pruned
+    permutations = [list(combination) for combination in product(*all_code_combinations)]
     
     return permutations
 
 
+def _is_numeric_only(tokens):
+    """Check whether tokens contain only digits and numeric date separators."""
+    return all(t.isdigit() or t in [",", "/", "-", "–", "."] for t in tokens)
+
+
+def _skeleton_is_numeric_only(tokens):
+    """Check whether skeleton tokens contain only numeric codes and separators."""
+    allowed = {"M", "MM", "d", "dd", "y", "yy", ",", "/", "-", "–", "."}
+    return all(t in allowed for t in tokens)
+
+
+def _detect_separator(expr_tokens):
+    """Return the first date separator present in the tokens (default '/')."""
+    present = _DATE_SEPARATORS.intersection(expr_tokens)
+    for s in ("/", ".", "-", "–"):
+        if s in present:
+            return s
+    return "/"
+
+
+def _find_range_dash(tokens):
+    """
+    Locate the range dash in a token list in a single pass.
+    
+    A hyphen takes precedence over an en dash, matching the order in which
+    ranges have always been split.
+    
+    Args:
+        tokens (list): Tokens to scan
+        
+    Returns:
+        tuple: (index, dash) or (-1, None) if no dash is present
+    """
+    en_dash_idx = -1
+    for i, t in enumerate(tokens):
+        if t == "-":
+            return i, "-"
+        if t == "–" and en_dash_idx == -1:
+            en_dash_idx = i
+    if en_dash_idx != -1:
+        return en_dash_idx, "–"
+    return -1, None
+
+
+def _split_range(tokens):
+    """
+    Split a token list on its range dash.
+    
+    Args:
+        tokens (list): Tokens to split
+        
+    Returns:
+        tuple: (left_tokens, right_tokens, dash) or (None, None, None) if no dash
+    """
+    idx, dash = _find_range_dash(tokens)
+    if dash is not None:
+        return tokens[:idx], tokens[idx+1:], dash
+    return None, None, None
+
+
+@functools.lru_cache(maxsize=2048)
+def _build_english_value_to_components(eng_tokens, eng_skel_tokens):
+    """
+    Pair English numeric values with skeleton components in order, preserving duplicates.
+    
+    The same English example is typically mapped against many target languages,
+    so the pairing is memoized on its (hashable) token tuples.
+    
+    Args:
+        eng_tokens (tuple): English tokens
+        eng_skel_tokens (tuple): English skeleton tokens
+        
+    Returns:
+        tuple: (value, component) pairs
+    """
+    comps = [t for t in eng_skel_tokens if t in ["M","MM","d","dd","y","yy"]]
+    pairs = []
+    vi = 0
+    for t in eng_tokens:
+        if t.isdigit():
+            if vi < len(comps):
+                pairs.append((int(t), comps[vi]))
+                vi += 1
+    return tuple(pairs)  # (value, component) pairs in order
+
+
+def _formats_for(value_str, comp_type):
+    """Return the skeleton format options for a numeric target value and component type."""
+    return _NUMERIC_FORMAT_OPTIONS.get((len(value_str), value_str.startswith("0"), comp_type[:1]), ())
+
+
+def _available_components_for_target(v_str, value_to_components, year_suffixes, yy_values):
+    """
+    Find the English component types a numeric target value can stand for.
+    
+    Args:
+        v_str (str): Target numeric value
+        value_to_components (dict): English value -> list of components
+        year_suffixes (set): Last two digits of the English 4-digit years
+        yy_values (set): English values written as yy
+        
+    Returns:
+        list: Available component types (may contain duplicates)
+    """
+    iv = int(v_str)
+    comps = list(value_to_components.get(iv, []))
+    # Year truncation allowance: if target is 2-digit and matches last-2 of an English year
+    if len(v_str) == 2 and iv in year_suffixes:
+        # Treat as a year component available
+        comps.append('y')
+    # Year expansion allowance: if target is 4-digit and its last-2 match an English yy
+    if len(v_str) == 4 and int(v_str[-2:]) in yy_values:
+        comps.append('y')
+    return comps
+
+
+@functools.lru_cache(maxsize=2048)
+def _generate_for_side(eng_side_tokens, eng_skel_side, tgt_side_tokens):
+    """
+    Generate numeric skeleton options for one side of a numeric-only expression.
+    
+    Results are memoized so batches that repeat the same numeric date (or
+    the same range side across target languages) skip the backtracking search.
+    
+    Args:
+        eng_side_tokens (tuple): English tokens for this side
+        eng_skel_side (str): English skeleton for this side
+        tgt_side_tokens (tuple): Target tokens for this side
+        
+    Returns:
+        tuple: Sorted unique target skeleton strings (empty if values cannot be mapped)
+    """
+    sep = _detect_separator(tgt_side_tokens)
+    eng_vals = [t for t in eng_side_tokens if t.isdigit()]
+    tgt_vals = [t for t in tgt_side_tokens if t.isdigit()]
+    if not eng_vals or not tgt_vals:
+        return ()
+    eng_pairs = _build_english_value_to_components(eng_side_tokens, tuple(_tokenize(eng_skel_side)))
+    # Count availability of each value's component types
+    value_to_components = defaultdict(list)
+    for val, comp in eng_pairs:
+        value_to_components[val].append(comp)
+    # Per-value component multiplicities, so allowed counts are O(1) lookups
+    value_to_counts = {val: Counter(comps) for val, comps in value_to_components.items()}
+    # Year facts about the English side, computed once rather than per target value
+    year_suffixes = {val % 100 for val, comp in eng_pairs if len(str(val)) == 4 and comp.startswith('y')}
+    yy_values = {val for val, comp in eng_pairs if comp == 'yy'}
+    
+    # Precompute, once per distinct target value, every (key, allowed uses, format)
+    # choice: the component instances it can take and their format options
+    choices_for_value = {}
+    for v_str in tgt_vals:
+        if v_str in choices_for_value:
+            continue
+        comps_avail = _available_components_for_target(v_str, value_to_components, year_suffixes, yy_values)
+        # Validate mapping existence per target value
+        if not comps_avail:
+            return ()
+        exact_counts = value_to_counts.get(int(v_str), {})
+        choices = []
+        for comp in comps_avail:
+            # Compute total allowed count for this comp for this value_str
+            # If comp came from exact matches, count them; if from year-truncation, allow one use
+            if comp == 'y' and len(v_str) == 2 and comp not in exact_counts:
+                total_allowed = 1
+            else:
+                # exact matches count
+                total_allowed = exact_counts.get(comp, 0)
+            # Determine format options for this target value and component type
+            for o in _formats_for(v_str, comp):
+                choices.append(((v_str, comp), max(1, total_allowed), o))
+        choices_for_value[v_str] = choices
+    level_choices = [choices_for_value[v_str] for v_str in tgt_vals]
+
+    # Iterative backtracking to assign components to target occurrences while
+    # respecting multiplicity; stack[i] iterates the choices for target value i
+    results = []
+    assigned = []
+    assigned_keys = []
+    used_counts = defaultdict(int)
+    stack = [iter(level_choices[0])]
+
+    while stack:
+        for key, allowed, o in stack[-1]:
+            if used_counts[key] < allowed:
+                break
+        else:
+            # Level exhausted - undo the choice that led into it
+            stack.pop()
+            if assigned_keys:
+                used_counts[assigned_keys.pop()] -= 1
+                assigned.pop()
+            continue
+
+        assigned.append(o)
+        assigned_keys.append(key)
+        used_counts[key] += 1
+        depth = len(assigned)
+
+        if depth == len(tgt_vals):
+            results.append(list(assigned))
+        elif all(any(used_counts[k] < a for k, a, _ in level_choices[j])
+                 for j in range(depth, len(tgt_vals))):
+            stack.append(iter(level_choices[depth]))
+            continue
+
+        # Complete assignment, or a remaining value has nothing left to take
+        used_counts[assigned_keys.pop()] -= 1
+        assigned.pop()
+    # Rebuild skeleton strings with separator retained
+    skeletons = [sep.join(r) for r in results]
+    # Note: Removed overly restrictive filtering that was preventing valid combinations like M/dd/y
+    # The previous filter was removing valid skeleton options where numbers > 9 create ambiguity
+    # All generated combinations should be valid since the backtracking already ensures correctness
+    filtered = skeletons
+    # De-dup
+    return tuple(sorted(set(filtered)))
+
+
+def _numeric_token_mappings(eng_token, skeleton_code, target_year=None):
+    """
+    Map an English numeric token, and the target spellings it may take, to skeleton codes.
+    
+    Args:
+        eng_token (str): English numeric token (e.g., "5", "12", "2024")
+        skeleton_code (str): Its English skeleton code (M, MM, d, dd, y, yy)
+        target_year (str): First 4-digit number in the target, if any
+        
+    Returns:
+        dict: Token -> list of skeleton codes
+    """
+    mappings = {eng_token: [skeleton_code]}
+    
+    if skeleton_code in ("M", "d"):
+        padded_skeleton = "MM" if skeleton_code == "M" else "dd"
+        if len(eng_token) == 1:
+            # The target may zero-pad a single digit
+            mappings["0" + eng_token] = [padded_skeleton]
+        elif len(eng_token) == 2 and int(eng_token) >= 10:
+            mappings[eng_token].append(padded_skeleton)
+    
+    elif skeleton_code in ("MM", "dd"):
+        if len(eng_token) == 2 and int(eng_token) >= 10:
+            mappings[eng_token].append("M" if skeleton_code == "MM" else "d")
+    
+    elif skeleton_code == "y" and len(eng_token) == 4:
+        mappings[eng_token[-2:]] = ["yy"]
+    
+    elif skeleton_code == "yy" and len(eng_token) == 2:
+        # Infer the full year from a 4-digit year in the target
+        if target_year and target_year.endswith(eng_token):
+            mappings[target_year] = ["y"]
+    
+    return mappings
+
+
 def map_english_to_target_skeleton(english_tokens, english_skeleton, target_tokens, target_date_dict, ambiguities=None, original_target_expression=None):
     """
     Map English date expression to target language skeleton.
@@ -270,203 +580,115 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
     Returns:
         list: List of valid target skeleton strings
     """
+    # The mapping is deterministic in its inputs, so results are memoized on a
+    # hashable snapshot of them (dict insertion order is kept, as it decides
+    # which variant wins when target forms collide)
+    target_date_dict_key = tuple((key, tuple(values)) for key, values in target_date_dict.items())
+    skeletons, messages = _map_english_to_target_skeleton(
+        tuple(english_tokens), english_skeleton, tuple(target_tokens),
+        target_date_dict_key, original_target_expression
+    )
+    
+    # Diagnostics are printed here rather than in the cached core, so repeated
+    # inputs report the same output as the first call
+    for message in messages:
+        print(message)
+    return list(skeletons)
+
+
+@functools.lru_cache(maxsize=4096)
+def _map_english_to_target_skeleton(english_tokens, english_skeleton, target_tokens, target_date_dict_key, original_target_expression):
+    """
+    Cached implementation of map_english_to_target_skeleton.
+    
+    Args:
+        english_tokens (tuple): Tokenized English expression
+        english_skeleton (str): English skeleton pattern
+        target_tokens (tuple): Tokenized target language expression
+        target_date_dict_key (tuple): Target date dictionary as (key, values) pairs
+        original_target_expression (str): Original target expression for error messages
+        
+    Returns:
+        tuple: (skeletons, messages) - valid target skeleton strings and the
+        diagnostic messages to print for them, in order
+    """
+    messages = []
+    try:
+        skeletons = _build_target_skeletons(
+            english_tokens, english_skeleton, target_tokens,
+            target_date_dict_key, original_target_expression, messages.append
+        )
+    except Exception:
+        # Failures are not cached, so their diagnostics are printed right away
+        for message in messages:
+            print(message)
+        raise
+    return skeletons, tuple(messages)
+
+
+def _build_target_skeletons(english_tokens, english_skeleton, target_tokens, target_date_dict_key, original_target_expression, log):
+    """
+    Build the target skeletons for map_english_to_target_skeleton.
+    
+    Args:
+        english_tokens (tuple): Tokenized English expression
+        english_skeleton (str): English skeleton pattern
+        target_tokens (tuple): Tokenized target language expression
+        target_date_dict_key (tuple): Target date dictionary as (key, values) pairs
+        original_target_expression (str): Original target expression for error messages
+        log (callable): Receives each diagnostic message in order
+        
+    Returns:
+        tuple: Valid target skeleton strings
+    """
+    english_tokens = list(english_tokens)
+    target_tokens = list(target_tokens)
+    target_date_dict = {key: list(values) for key, values in target_date_dict_key}
+    
     # Validate English date values first
     validate_english_date_values(english_tokens, english_skeleton)
     
-    # Initialize variables
-    if ambiguities is None:
-        ambiguities = []
-    
-    print(f"Target tokenized: {target_tokens}")
-    print(f"English skeleton: {english_skeleton}")
+    log(f"Target tokenized: {target_tokens}")
+    log(f"English skeleton: {english_skeleton}")
     
     # Tokenize English skeleton for mapping
-    english_skeleton_tokenized = regex.findall(TOKEN_PATTERN, english_skeleton)
-    print(f"English skeleton tokenized: {english_skeleton_tokenized}")
+    english_skeleton_tokenized = _tokenize(english_skeleton)
+    log(f"English skeleton tokenized: {english_skeleton_tokenized}")
+    
+    # Check if the English skeleton uses standalone context (L/c codes) or formatting context (M/E codes)
+    english_uses_standalone = False
+    for code in english_skeleton_tokenized:
+        if code and code[0] in 'Lc':
+            english_uses_standalone = True
+            break
     
-    english_tokenized = regex.findall(TOKEN_PATTERN, " ".join(english_tokens))
-    print(f"English tokenized: {english_tokenized}")
+    # Callers pass tokenize_date_expression() output, so the tokens are already
+    # split on TOKEN_PATTERN; re-joining and re-tokenizing would be a no-op
+    english_tokenized = english_tokens
+    log(f"English tokenized: {english_tokenized}")
 
     # ------------------------------------------------------------------
     # Special-case fast path: numeric-only dates with separators (M/d[/y], ranges)
     # Implements the user's Made-Up skeleton spec precisely for numeric cases
     # ------------------------------------------------------------------
-    def is_numeric_only(tokens):
-        return all(t.isdigit() or t in [",", "/", "-", "–", "."] for t in tokens)
-
-    def skeleton_is_numeric_only(tokens):
-        allowed = {"M", "MM", "d", "dd", "y", "yy", ",", "/", "-", "–", "."}
-        return all(t in allowed for t in tokens)
-
-    english_skeleton_tokens_simple = regex.findall(TOKEN_PATTERN, english_skeleton)
-
-    if is_numeric_only(target_tokens) and is_numeric_only(english_tokenized) and skeleton_is_numeric_only(english_skeleton_tokens_simple):
-        print("Using numeric-only mapping fast path")
-
-        def detect_separator(expr_tokens):
-            for s in ["/", ".", "-", "–"]:
-                if s in expr_tokens:
-                    return s
-            return "/"
-
-        def split_components(tokens, sep):
-            comps = []
-            current = []
-            for t in tokens:
-                if t == sep:
-                    if current:
-                        comps.append("".join(current))
-                        current = []
-                else:
-                    if t.isdigit():
-                        current.append(t)
-            if current:
-                comps.append("".join(current))
-            return comps
-
-        def parse_int_list(str_list):
-            try:
-                return [int(x) for x in str_list]
-            except Exception:
-                return None
-
-        # Handle ranges by splitting both sides and cross-product later
-        def split_range(tokens):
-            if "-" in tokens or "–" in tokens:
-                dash = "-" if "-" in tokens else "–"
-                idx = tokens.index(dash)
-                return tokens[:idx], tokens[idx+1:], dash
-            return None, None, None
-
-        # Build mapping from English values to skeleton components preserving duplicates
-        def build_english_value_to_components(eng_tokens, eng_skel_tokens):
-            values = [int(t) for t in eng_tokens if t.isdigit()]
-            comps = [t for t in eng_skel_tokens if t in ["M","MM","d","dd","y","yy"]]
-            pairs = []
-            vi = 0
-            for t in eng_tokens:
-                if t.isdigit():
-                    if vi < len(comps):
-                        pairs.append((int(t), comps[vi]))
-                        vi += 1
-            return pairs  # list of (value, component) in order
+    # The skeleton check runs first on the raw string: any letter other than
+    # M/d/y (E, L, c, ...) rules the fast path out without scanning tokens
+    if (not any(ch.isalpha() and ch not in 'Mdy' for ch in english_skeleton)
+            and _skeleton_is_numeric_only(english_skeleton_tokenized)
+            and _is_numeric_only(target_tokens) and _is_numeric_only(english_tokenized)):
+        log("Using numeric-only mapping fast path")
 
         # Validate English numeric bounds explicitly (month<=12, day<=31)
-        eng_pairs_full = build_english_value_to_components(english_tokenized, english_skeleton_tokens_simple)
+        eng_pairs_full = _build_english_value_to_components(tuple(english_tokenized), tuple(english_skeleton_tokenized))
         for val, comp in eng_pairs_full:
             if comp.startswith('M') and val > 12:
                 raise ValueError("Invalid month value in English example (must be 1-12)")
             if comp.startswith('d') and val > 31:
                 raise ValueError("Invalid day value in English example (must be 1-31)")
 
-        def formats_for(value_str, comp_type):
-            # Apply formatting rules from spec
-            if comp_type.startswith("y"):
-                return ["y"] if len(value_str) == 4 else (["yy"] if len(value_str) == 2 else [])
-            if comp_type.startswith("M"):
-                if len(value_str) == 1:
-                    return ["M"]
-                if len(value_str) == 2 and value_str.startswith("0"):
-                    return ["MM"]
-                if len(value_str) == 2:
-                    return ["M","MM"]
-            if comp_type.startswith("d"):
-                if len(value_str) == 1:
-                    return ["d"]
-                if len(value_str) == 2 and value_str.startswith("0"):
-                    return ["dd"]
-                if len(value_str) == 2:
-                    return ["d","dd"]
-            return []
-
-        def generate_for_side(eng_side_tokens, eng_skel_side, tgt_side_tokens):
-            sep = detect_separator(tgt_side_tokens)
-            eng_vals = [t for t in eng_side_tokens if t.isdigit()]
-            tgt_vals = [t for t in tgt_side_tokens if t.isdigit()]
-            if not eng_vals or not tgt_vals:
-                return []
-            eng_pairs = build_english_value_to_components(eng_side_tokens, regex.findall(TOKEN_PATTERN, eng_skel_side))
-            # Count availability of each value's component types
-            from collections import defaultdict
-            value_to_components = defaultdict(list)
-            for val, comp in eng_pairs:
-                value_to_components[val].append(comp)
-            
-            # Helper to find available component types for a target value string
-            def available_components_for_target(v_str: str):
-                iv = int(v_str)
-                comps = list(value_to_components.get(iv, []))
-                # Year truncation allowance: if target is 2-digit and matches last-2 of an English year
-                if len(v_str) == 2:
-                    for ev, ec in eng_pairs:
-                        if str(ev).isdigit() and len(str(ev)) == 4 and (ev % 100) == iv and ec.startswith('y'):
-                            # Treat as a year component available
-                            comps.append('y')
-                            break
-                # Year expansion allowance: if target is 4-digit and its last-2 match an English yy
-                if len(v_str) == 4:
-                    last2 = int(v_str[-2:])
-                    for ev, ec in eng_pairs:
-                        if ec == 'yy' and ev == last2:
-                            comps.append('y')
-                            break
-                return comps
-
-            # Validate mapping existence per target value
-            for v in tgt_vals:
-                if not available_components_for_target(v):
-                    return []
-            # Backtracking to assign components to target occurrences while respecting multiplicity
-            results = []
-            assigned = []
-            used_counts = defaultdict(int)
-
-            def backtrack(idx):
-                if idx == len(tgt_vals):
-                    results.append(list(assigned))
-                    return
-                v_str = tgt_vals[idx]
-                comps_avail = available_components_for_target(v_str)
-                # Try each remaining component instance
-                tried = 0
-                for comp in comps_avail:
-                    key = (v_str, comp)
-                    # Compute total allowed count for this comp for this value_str
-                    # If comp came from exact matches, count them; if from year-truncation, allow one use
-                    total_allowed = 0
-                    if comp == 'y' and len(v_str) == 2 and comp not in value_to_components.get(int(v_str), []):
-                        total_allowed = 1
-                    else:
-                        # exact matches count
-                        total_allowed = value_to_components[int(v_str)].count(comp) if v_str.isdigit() else 0
-                    if used_counts[key] < max(1, total_allowed):
-                        # Determine format options for this target value and component type
-                        opts = formats_for(v_str, comp)
-                        if not opts:
-                            continue
-                        for o in opts:
-                            assigned.append(o)
-                            used_counts[key] += 1
-                            backtrack(idx+1)
-                            used_counts[key] -= 1
-                            assigned.pop()
-                        tried += 1
-                if tried == 0:
-                    return
-
-            backtrack(0)
-            # Rebuild skeleton strings with separator retained
-            skeletons = [sep.join(r) for r in results]
-            # Note: Removed overly restrictive filtering that was preventing valid combinations like M/dd/y
-            # The previous filter was removing valid skeleton options where numbers > 9 create ambiguity
-            # All generated combinations should be valid since the backtracking already ensures correctness
-            filtered = skeletons
-            # De-dup
-            return sorted(list(dict.fromkeys(filtered)))
-
         # Range handling
-        e_left, e_right, dash = split_range(english_tokenized)
-        t_left, t_right, dash_t = split_range(target_tokens)
+        e_left, e_right, dash = _split_range(english_tokenized)
+        t_left, t_right, dash_t = _split_range(target_tokens)
 
         # Treat as a range ONLY if both sides clearly have a dash
         if dash and dash_t:
@@ -475,8 +697,8 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
             else:
                 eng_skel_parts = english_skeleton.replace("–","-").split("-")
                 if len(eng_skel_parts) == 2:
-                    left_opts = generate_for_side(e_left, eng_skel_parts[0].strip(), t_left)
-                    right_opts = generate_for_side(e_right, eng_skel_parts[1].strip(), t_right)
+                    left_opts = _generate_for_side(tuple(e_left), eng_skel_parts[0].strip(), tuple(t_left))
+                    right_opts = _generate_for_side(tuple(e_right), eng_skel_parts[1].strip(), tuple(t_right))
                     if not left_opts or not right_opts:
                         raise ValueError("Inadequate mapping of numeric elements in range")
                     out = []
@@ -485,13 +707,13 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
                             # Check for formatting consistency between left and right sides
                             if has_consistent_formatting(a, b):
                                 out.append(f"{a} - {b}")
-                    print(f"Final target skeleton strings: {out}")
-                    return out
+                    log(f"Final target skeleton strings: {out}")
+                    return tuple(out)
         else:
-            opts = generate_for_side(english_tokenized, english_skeleton, target_tokens)
+            opts = _generate_for_side(tuple(english_tokenized), english_skeleton, tuple(target_tokens))
             if not opts:
                 raise ValueError("Inadequate mapping of numeric elements. The translation does not properly correspond to the English expression.")
-            print(f"Final target skeleton strings: {opts}")
+            log(f"Final target skeleton strings: {list(opts)}")
             return opts
     
     # Analyze original target expression to preserve spacing
@@ -500,70 +722,67 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
         original_target_expression = " ".join(target_tokens)
     
     spacing_info = []
+    # Target tokens with any ATTACHED_PREFIX stripped, shared by the loops below
+    actual_tokens = []
     
     # Track spacing between tokens in the original expression
     current_pos = 0
     for i, token in enumerate(target_tokens):
-        # Handle ATTACHED tokens
-        actual_token = token[9:] if token.startswith("ATTACHED:") else token
+        # Handle ATTACHED tokens (compound words) - they have no space before them
+        attached = token.startswith(ATTACHED_PREFIX)
+        actual_token = token[len(ATTACHED_PREFIX):] if attached else token
+        actual_tokens.append(actual_token)
         
-        # Find the actual token in the original expression
+        # Find the actual token in the original expression, scanning forward
+        # from the end of the previous token
         token_start = original_target_expression.find(actual_token, current_pos)
+        token_end = token_start + len(actual_token)
         
-        if i > 0:
-            # Check if there's a space before this token
-            prev_token_end = spacing_info[i-1]['end']
-            has_space_before = token_start > prev_token_end
-            spacing_info.append({
-                'token': token,
-                'start': token_start,
-                'end': token_start + len(actual_token),
-                'has_space_before': has_space_before
-            })
-        else:
-            spacing_info.append({
-                'token': token,
-                'start': token_start,
-                'end': token_start + len(actual_token),
-                'has_space_before': False
-            })
+        spacing_info.append({
+            'token': token,
+            'start': token_start,
+            'end': token_end,
+            # There's a space before this token if it starts past the previous one's end
+            'has_space_before': not attached and i > 0 and token_start > current_pos
+        })
         
-        current_pos = token_start + len(actual_token)
+        current_pos = token_end
     
-    print(f"Spacing info: {spacing_info}")
+    log(f"Spacing info: {spacing_info}")
     
     # Categorize target tokens and build target date lexicon
-    target_date_lexicon = []
+    target_date_lexicon = set()
     for category_list in target_date_dict.values():
-        target_date_lexicon.extend(category_list)
+        target_date_lexicon.update(category_list)
     
     categorized_target_tokens = []
-    for i, token in enumerate(target_tokens):
-        spacing = spacing_info[i] if i < len(spacing_info) else {'has_space_before': True}
-        
-        # Handle attached tokens (compound words)
-        if token.startswith("ATTACHED:"):
-            actual_token = token[9:]  # Remove "ATTACHED:" prefix
-            spacing['has_space_before'] = False  # Attached tokens have no space
-            token = actual_token
-        
+    add_categorized = categorized_target_tokens.append
+    # spacing_info holds exactly one entry per target token, in order
+    for token, spacing in zip(actual_tokens, spacing_info):
         if token.isnumeric():
-            categorized_target_tokens.append(('numeric', token, spacing))
+            cat = 'numeric'
         elif token in [",", "/", "-", "–", ".", "،", "؛", "؟", "！", "？", "。", "ฯ", "ๆ", "־", "፣", "።", "፤", "፥", "፦", "፧", "፨"]:
-            categorized_target_tokens.append(('punctuation', token, spacing))
+            cat = 'punctuation'
         elif token in target_date_lexicon:
-            categorized_target_tokens.append(('date_element', token, spacing))
+            cat = 'date_element'
         else:
             # This is literal text - will be wrapped in quotes
-            categorized_target_tokens.append(('literal', token, spacing))
-            print(f"Note: '{token}' will be treated as literal text")
+            cat = 'literal'
+        
+        # Record digit-ness once so the assembly loops below don't re-check it
+        add_categorized((cat, token, spacing, token.isdigit()))
     
-    print(f"Categorized target tokens: {[(cat, token) for cat, token, spacing in categorized_target_tokens]}")
+    log(f"Categorized target tokens: {[(cat, token) for cat, token, spacing, is_digit in categorized_target_tokens]}")
     
     # Create mapping from English date elements to all their target language variants
     english_to_target_variants = {}
     target_element_to_skeleton = {}
     english_element_mappings = {}  # Initialize the dictionary
+    # One shared single-code list per skeleton code for date element variants
+    code_list_cache = {}
+    # First 4-digit target number, used to expand an English yy to a full year
+    target_year = next((token for cat, token, spacing, is_digit in categorized_target_tokens
+                        if cat == 'numeric' and len(token) == 4), None)
     
     # For each English token, find all possible target language variants
     for i, eng_token in enumerate(english_tokenized):
@@ -571,55 +790,16 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
             skeleton_code = english_skeleton_tokenized[i]
             
             if eng_token.isnumeric():
-                # Handle numeric tokens (already working correctly)
-                english_element_mappings[eng_token] = [skeleton_code]
-                
-                # Add numeric variations
-                if skeleton_code in ["M", "d"]:
-                    if len(eng_token) == 1:
-                        zero_padded = "0" + eng_token
-                        new_skeleton = "MM" if skeleton_code == "M" else "dd"
-                        english_element_mappings[zero_padded] = [new_skeleton]
-                    elif len(eng_token) == 2 and int(eng_token) >= 10:
-                        padded_skeleton = "MM" if skeleton_code == "M" else "dd"
-                        if eng_token not in english_element_mappings:
-                            english_element_mappings[eng_token] = []
-                        english_element_mappings[eng_token].append(padded_skeleton)
-                
-                elif skeleton_code in ["MM", "dd"]:
-                    if len(eng_token) == 2 and int(eng_token) >= 10:
-                        minimal_skeleton = "M" if skeleton_code == "MM" else "d"
-                        if eng_token not in english_element_mappings:
-                            english_element_mappings[eng_token] = []
-                        english_element_mappings[eng_token].append(minimal_skeleton)
-                
-                elif skeleton_code == "y" and len(eng_token) == 4:
-                    abbreviated_year = eng_token[-2:]
-                    english_element_mappings[abbreviated_year] = ["yy"]
-                
-                elif skeleton_code == "yy" and len(eng_token) == 2:
-                    # Look for 4-digit year in target to infer full year
-                    target_4digit_years = [token for cat, token, spacing in categorized_target_tokens 
-                                         if cat == 'numeric' and len(token) == 4]
-                    if target_4digit_years:
-                        full_year = target_4digit_years[0]
-                        if full_year.endswith(eng_token):
-                            english_element_mappings[full_year] = ["y"]
+                # Handle numeric tokens and their padded/truncated variants
+                english_element_mappings.update(
+                    _numeric_token_mappings(eng_token, skeleton_code, target_year)
+                )
             
-            elif any(eng_token.lower() == item.lower() for item in sum(ENGLISH_DATE_DICT.values(), [])):
+            elif eng_token.lower() in _ENGLISH_ELEMENT_POSITIONS:
                 # Handle date elements - find ALL variants in target language
                 
                 # Find which category this English element belongs to
-                eng_category = None
-                eng_index = None
-                for key in ENGLISH_DATE_DICT:
-                    for idx, item in enumerate(ENGLISH_DATE_DICT[key]):
-                        if item.lower() == eng_token.lower():
-                            eng_category = key
-                            eng_index = idx
-                            break
-                    if eng_category:
-                        break
+                eng_category, eng_index = _ENGLISH_ELEMENT_POSITIONS[eng_token.lower()]
                 
                 if eng_category and eng_index is not None and eng_category in target_date_dict:
                     # Get the target translation for this index
@@ -646,46 +826,38 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
                         }
                         
                         if base_category in format_skeleton_map:
-                            # Find all variants of this element in target language
-                            for target_key in target_date_dict:
-                                if target_key.startswith(base_category):
-                                    if eng_index < len(target_date_dict[target_key]):
-                                        variant_text = target_date_dict[target_key][eng_index]
-                                        
-                                        # Determine format length from key and context
-                                        if '_nar_' in target_key:
-                                            length_code = 'nar'
-                                        elif '_abb_' in target_key:
-                                            length_code = 'abb'
-                                        elif '_wid_' in target_key:
-                                            length_code = 'wid'
-                                        elif '_sho_' in target_key:
-                                            length_code = 'sho'
-                                        else:
-                                            continue
-                                        
-                                        # Determine context based on English skeleton, not target key
-                                        # Check if the English skeleton uses standalone context (L/c codes) or formatting context (M/E codes)
-                                        english_uses_standalone = any(code.startswith('L') or code.startswith('c') for code in english_skeleton_tokenized)
-                                        
-                                        if english_uses_standalone:
-                                            # English uses standalone context - use L/c codes
-                                            format_code = standalone_skeleton_map[base_category][length_code]
-                                        else:
-                                            # English uses formatting context - use M/E codes
-                                            format_code = format_skeleton_map[base_category][length_code]
-                                        
-                                        # Store mapping from target variant to its skeleton code
-                                        target_element_to_skeleton[variant_text] = format_code
-                                        
-                                        # Also store in english_element_mappings for compatibility
-                                        english_element_mappings[variant_text] = [format_code]
-    
-    print(f"Target element to skeleton mappings: {target_element_to_skeleton}")
-    print(f"English element mappings: {english_element_mappings}")
+                            # Determine context based on English skeleton, not target key:
+                            # standalone English skeletons use L/c codes, formatting ones M/E codes
+                            if english_uses_standalone:
+                                skeleton_code_for_length = standalone_skeleton_map[base_category]
+                            else:
+                                skeleton_code_for_length = format_skeleton_map[base_category]
+                            
+                            # Find all variants of this element in target language, keyed by
+                            # the format length in the key (e.g., 'nar' in 'mon_nar_for')
+                            variant_codes = {
+                                target_date_dict[target_key][eng_index]: skeleton_code_for_length[target_key.split('_')[1]]
+                                for target_key in target_date_dict
+                                if target_key.startswith(base_category)
+                                and eng_index < len(target_date_dict[target_key])
+                                and target_key.split('_')[1] in skeleton_code_for_length
+                            }
+                            
+                            # Store mapping from target variant to its skeleton code
+                            target_element_to_skeleton.update(variant_codes)
+                            
+                            # Also store in english_element_mappings for compatibility
+                            english_element_mappings.update({
+                                variant_text: code_list_cache.setdefault(format_code, [format_code])
+                                for variant_text, format_code in variant_codes.items()
+                            })
+    
+    log(f"Target element to skeleton mappings: {target_element_to_skeleton}")
+    log(f"English element mappings: {english_element_mappings}")
     
     # Now build target skeleton by processing each target token with spacing preserved
     possible_skeletons = [[]]  # Start with one empty skeleton
+    target_skeleton_strings = []
     
     # Build a more flexible mapping approach for cases with mismatched token counts
     # due to literal text in target language
@@ -693,75 +865,90 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
     # First, identify which target tokens can be mapped to English elements
     mappable_targets = []
     literal_targets = []
+    # Numeric mappable tokens and their values, collected in the same pass
+    numeric_tokens = []
+    # Codes of the first mappable target for each token text
+    mappable_codes_by_token = {}
     
-    for cat, token, spacing in categorized_target_tokens:
+    for cat, token, spacing, is_digit in categorized_target_tokens:
         if cat == 'punctuation':
             continue  # Handle punctuation separately
         elif cat == 'literal':
             literal_targets.append((token, spacing))
         elif cat in ['numeric', 'date_element'] and token in english_element_mappings:
             mappable_targets.append((token, english_element_mappings[token], spacing))
+            mappable_codes_by_token.setdefault(token, english_element_mappings[token])
+            if is_digit:
+                numeric_tokens.append((token, int(token)))
         else:
             # Unmappable date element or number - treat as literal
             literal_targets.append((token, spacing))
     
-    print(f"Mappable targets: {[(token, codes) for token, codes, spacing in mappable_targets]}")
-    print(f"Literal targets: {[token for token, spacing in literal_targets]}")
+    log(f"Mappable targets: {[(token, codes) for token, codes, spacing in mappable_targets]}")
+    log(f"Literal targets: {[token for token, spacing in literal_targets]}")
     
     # Generate all valid skeleton permutations for numeric tokens
     if mappable_targets:
-        # Extract numeric tokens and their values
-        numeric_tokens = [(token, int(token)) for token, codes, spacing in mappable_targets if token.isdigit()]
-        
         if len(numeric_tokens) >= 2:
             # Generate all valid month/day permutations
             valid_permutations = generate_month_day_permutations(numeric_tokens, english_skeleton, english_tokenized)
             
-            for permutation in valid_permutations:
-                skeleton_parts = []
-                mappable_index = 0
+            # Only the first digit_slots codes of a permutation reach the skeleton
+            # (one per digit token below), so permutations that differ only past
+            # that point would build identical skeletons - drop them up front
+            digit_slots = sum(1 for cat, token, spacing, is_digit in categorized_target_tokens
+                              if is_digit and cat in ['numeric', 'date_element'])
+            valid_permutations = list(dict.fromkeys(tuple(permutation[:digit_slots])
+                                                    for permutation in valid_permutations))
+            
+            # Everything except the permutation's codes is the same for every
+            # permutation, so build the parts once with a slot per digit token
+            # and fill the slots for each permutation
+            permutation_length = len(valid_permutations[0]) if valid_permutations else 0
+            template_parts = []
+            slot_positions = []
+            
+            for cat, token, spacing, is_digit in categorized_target_tokens:
+                if cat == 'punctuation':
+                    # Add punctuation with spacing
+                    if spacing['has_space_before'] and template_parts:
+                        template_parts.extend([' ', token])
+                    else:
+                        template_parts.append(token)
                 
-                for cat, token, spacing in categorized_target_tokens:
-                    if cat == 'punctuation':
-                        # Add punctuation with spacing
-                        if spacing['has_space_before'] and skeleton_parts:
-                            skeleton_parts.extend([' ', token])
-                        else:
-                            skeleton_parts.append(token)
-                    
-                    elif cat == 'literal':
-                        # Add literal text wrapped in quotes with spacing
-                        quoted_literal = f"'{token}'"
-                        if spacing['has_space_before'] and skeleton_parts:
-                            skeleton_parts.extend([' ', quoted_literal])
+                elif cat == 'literal':
+                    # Add literal text wrapped in quotes with spacing
+                    if spacing['has_space_before'] and template_parts:
+                        template_parts.extend([' ', "'", token, "'"])
+                    else:
+                        template_parts.extend(["'", token, "'"])
+                
+                elif cat in ['numeric', 'date_element']:
+                    if is_digit and len(slot_positions) < permutation_length:
+                        # Slot for the skeleton code from the permutation
+                        if spacing['has_space_before'] and template_parts:
+                            template_parts.append(' ')
+                        slot_positions.append(len(template_parts))
+                        template_parts.append(None)
+                    elif token in english_element_mappings:
+                        # Use the first available skeleton code
+                        skeleton_code = english_element_mappings[token][0]
+                        
+                        if spacing['has_space_before'] and template_parts:
+                            template_parts.extend([' ', skeleton_code])
                         else:
-                            skeleton_parts.append(quoted_literal)
-                    
-                    elif cat in ['numeric', 'date_element']:
-                        if token.isdigit() and mappable_index < len(permutation):
-                            # Use the skeleton code from the permutation
-                            skeleton_code = permutation[mappable_index]
-                            mappable_index += 1
-                            
-                            if spacing['has_space_before'] and skeleton_parts:
-                                skeleton_parts.extend([' ', skeleton_code])
-                            else:
-                                skeleton_parts.append(skeleton_code)
-                        elif token in english_element_mappings:
-                            # Use the first available skeleton code
-                            skeleton_code = english_element_mappings[token][0]
-                            
-                            if spacing['has_space_before'] and skeleton_parts:
-                                skeleton_parts.extend([' ', skeleton_code])
-                            else:
-                                skeleton_parts.append(skeleton_code)
+                            template_parts.append(skeleton_code)
+                    else:
+                        # Fallback to literal
+                        if spacing['has_space_before'] and template_parts:
+                            template_parts.extend([' ', "'", token, "'"])
                         else:
-                            # Fallback to literal
-                            quoted_literal = f"'{token}'"
-                            if spacing['has_space_before'] and skeleton_parts:
-                                skeleton_parts.extend([' ', quoted_literal])
-                            else:
-                                skeleton_parts.append(quoted_literal)
+                            template_parts.extend(["'", token, "'"])
+            
+            for permutation in valid_permutations:
+                skeleton_parts = list(template_parts)
+                for position, skeleton_code in zip(slot_positions, permutation):
+                    skeleton_parts[position] = skeleton_code
                 
                 if skeleton_parts:
                     possible_skeletons.append(skeleton_parts)
@@ -771,7 +958,7 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
             skeleton_parts = []
             mappable_index = 0
             
-            for cat, token, spacing in categorized_target_tokens:
+            for cat, token, spacing, is_digit in categorized_target_tokens:
                 if cat == 'punctuation':
                     # Add punctuation with spacing
                     if spacing['has_space_before'] and skeleton_parts:
@@ -781,102 +968,81 @@ def map_english_to_target_skeleton(english_tokens, english_skeleton, target_toke
                 
                 elif cat == 'literal':
                     # Add literal text wrapped in quotes with spacing
-                    quoted_literal = f"'{token}'"
                     if spacing['has_space_before'] and skeleton_parts:
-                        skeleton_parts.extend([' ', quoted_literal])
+                        skeleton_parts.extend([' ', "'", token, "'"])
                     else:
-                        skeleton_parts.append(quoted_literal)
+                        skeleton_parts.extend(["'", token, "'"])
                 
                 elif cat in ['numeric', 'date_element']:
                     # Find the correct mappable target for this token
-                    target_found = False
-                    for i, (mappable_token, mappable_codes, mappable_spacing) in enumerate(mappable_targets):
-                        if mappable_token == token:
-                            if token.isdigit():
-                                # Use the first available skeleton code for numeric tokens
-                                skeleton_code = mappable_codes[0]
-                            else:
-                                # Use the first available skeleton code for date elements
-                                skeleton_code = mappable_codes[0]
-                            
-                            if spacing['has_space_before'] and skeleton_parts:
-                                skeleton_parts.extend([' ', skeleton_code])
-                            else:
-                                skeleton_parts.append(skeleton_code)
-                            target_found = True
-                            break
-                    
-                    if not target_found:
+                    mappable_codes = mappable_codes_by_token.get(token)
+                    if mappable_codes is not None:
+                        # Use the first available skeleton code (numeric or date element)
+                        skeleton_code = mappable_codes[0]
+                        
+                        if spacing['has_space_before'] and skeleton_parts:
+                            skeleton_parts.extend([' ', skeleton_code])
+                        else:
+                            skeleton_parts.append(skeleton_code)
+                    else:
                         # Fallback to literal
-                        quoted_literal = f"'{token}'"
                         if spacing['has_space_before'] and skeleton_parts:
-                            skeleton_parts.extend([' ', quoted_literal])
+                            skeleton_parts.extend([' ', "'", token, "'"])
                         else:
-                            skeleton_parts.append(quoted_literal)
+                            skeleton_parts.extend(["'", token, "'"])
             
             if skeleton_parts:
                 possible_skeletons.append(skeleton_parts)
     
     else:
-        # No mappable targets - create skeleton with all literals
-        skeleton_parts = []
-        for cat, token, spacing in categorized_target_tokens:
+        # No mappable targets - only one all-literal skeleton is possible, so
+        # build its string directly instead of going through possible_skeletons
+        parts = []
+        for cat, token, spacing, is_digit in categorized_target_tokens:
+            prefix = ' ' if (spacing['has_space_before'] and parts) else ''
             if cat == 'punctuation':
-                if spacing['has_space_before'] and skeleton_parts:
-                    skeleton_parts.extend([' ', token])
-                else:
-                    skeleton_parts.append(token)
+                parts.append(prefix + token)
             else:
-                quoted_literal = f"'{token}'"
-                if spacing['has_space_before'] and skeleton_parts:
-                    skeleton_parts.extend([' ', quoted_literal])
-                else:
-                    skeleton_parts.append(quoted_literal)
+                parts.append(f"{prefix}'{token}'")
         
-        if skeleton_parts:
-            possible_skeletons.append(skeleton_parts)
+        literal_skeleton = ''.join(parts)
+        if literal_skeleton:
+            target_skeleton_strings.append(literal_skeleton)
     
     # Remove the empty initial skeleton
     possible_skeletons = [skeleton for skeleton in possible_skeletons if skeleton]
     
-    print(f"Possible target skeletons (parts): {possible_skeletons}")
+    log(f"Possible target skeletons (parts): {possible_skeletons}")
     
     # Convert skeleton parts to strings (just join them, spacing is already handled)
-    target_skeleton_strings = []
-    for skeleton_parts in possible_skeletons:
-        if skeleton_parts:
-            result = ''.join(str(part) for part in skeleton_parts)
-            if result and result not in target_skeleton_strings:
-                target_skeleton_strings.append(result)
+    # and de-dup in first-seen order
+    joined_skeletons = (''.join(skeleton_parts) for skeleton_parts in possible_skeletons)
+    target_skeleton_strings = list(dict.fromkeys(
+        target_skeleton_strings + [result for result in joined_skeletons if result]
+    ))
     
     # Apply consistency filtering for range expressions
-    if ' - ' in english_skeleton or '–' in english_skeleton or '—' in english_skeleton:
+    if any(range_separator in english_skeleton for range_separator in _RANGE_SKELETON_SEPARATORS):
         filtered_skeletons = []
         for skeleton in target_skeleton_strings:
-            # Check if this is a range skeleton
-            if ' - ' in skeleton or '–' in skeleton or '—' in skeleton:
-                # Split into left and right parts
-                if ' - ' in skeleton:
-                    left, right = skeleton.split(' - ', 1)
-                elif '–' in skeleton:
-                    left, right = skeleton.split('–', 1)
-                elif '—' in skeleton:
-                    left, right = skeleton.split('—', 1)
-                else:
-                    filtered_skeletons.append(skeleton)
-                    continue
-                
-                # Check consistency
-                if has_consistent_formatting(left.strip(), right.strip()):
-                    filtered_skeletons.append(skeleton)
-            else:
+            # Split range skeletons into left and right parts on the first
+            # separator present, in priority order
+            for range_separator in _RANGE_SKELETON_SEPARATORS:
+                left, found, right = skeleton.partition(range_separator)
+                if found:
+                    break
+            
+            if not found:
                 # Not a range skeleton, keep it
                 filtered_skeletons.append(skeleton)
+            elif has_consistent_formatting(left.strip(), right.strip()):
+                # Check consistency
+                filtered_skeletons.append(skeleton)
         
         target_skeleton_strings = filtered_skeletons
     
-    print(f"Final target skeleton strings: {target_skeleton_strings}")
-    return target_skeleton_strings
+    log(f"Final target skeleton strings: {target_skeleton_strings}")
+    return tuple(target_skeleton_strings)
 
 
 # Keep the old functions for backward compatibility but they won't be used
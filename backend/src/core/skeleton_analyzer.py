@@ -6,9 +6,16 @@ Core logic for analyzing tokens, determining possible date format interpretation
 generating skeleton combinations, and converting between semantic codes and CLDR skeletons.
 """
 
+import functools
 from itertools import product
 from .constants import SKELETON_CODES, ENGLISH_DATE_DICT, PUNCTUATION
 
+# Deletes the separators ignored when deciding whether an element has content
+_PUNCTUATION_STRIP = str.maketrans('', '', ',/-–.')
+
+# Tokens that split a multi-token expression into independent sections
+_SEPARATORS = frozenset(('-', '.', '–', '—'))
+
 
 def analyze_tokens_for_format_options(tokens, date_dict, is_standalone=None):
     """
@@ -25,22 +32,69 @@ def analyze_tokens_for_format_options(tokens, date_dict, is_standalone=None):
     if is_standalone is None:
         is_standalone = len(tokens) == 1
     
+    # The English dictionary is a module constant, so its results are cached;
+    # target dictionaries are built per request and analyzed directly
+    if date_dict is ENGLISH_DATE_DICT:
+        cached_options = _analyze_english_tokens(tuple(tokens), is_standalone)
+        return [list(token_options) for token_options in cached_options]
+    
+    return _analyze_tokens(tokens, date_dict, is_standalone)
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_english_tokens(tokens, is_standalone):
+    """
+    Cached analysis of tokens against ENGLISH_DATE_DICT.
+    
+    Args:
+        tokens (tuple): Tokens to analyze
+        is_standalone (bool): Whether this is standalone format
+        
+    Returns:
+        tuple: Tuple of tuples of possible format codes for each token
+    """
+    return tuple(
+        tuple(token_options)
+        for token_options in _analyze_tokens(tokens, ENGLISH_DATE_DICT, is_standalone)
+    )
+
+
+def _analyze_tokens(tokens, date_dict, is_standalone):
+    """
+    Implementation of analyze_tokens_for_format_options.
+    
+    Args:
+        tokens (list): List of tokens to analyze
+        date_dict (dict): Date dictionary to use for lookup
+        is_standalone (bool): Whether this is standalone format
+        
+    Returns:
+        list: List of lists, each containing possible format codes for each token
+    """
     formatting_options = []
+    # Case-folded entries of the keys valid in this context, built on the first
+    # alphabetic token instead of lowercasing every entry for every token
+    lowered_entries = None
     
     for token in tokens:
         token_options = []
         
-        if token.isalpha() or (isinstance(token, str) and any(c.isalpha() for c in token)):
-            # Check alphabetic tokens against date dictionary
-            for key in date_dict.keys():
-                # Filter keys based on standalone vs format context
-                if is_standalone and key.endswith("for"):
-                    continue
-                if not is_standalone and key.endswith("sta"):
-                    continue
-                
-                # Case-insensitive matching
-                if any(token.lower() == item.lower() for item in date_dict[key]):
+        # Any alphabetic character marks a word token (this also covers fully
+        # alphabetic tokens, so no separate isalpha() pass is needed)
+        if any(map(str.isalpha, token)):
+            if lowered_entries is None:
+                lowered_entries = {
+                    key: {item.lower() for item in items}
+                    for key, items in date_dict.items()
+                    # Filter keys based on standalone vs format context
+                    if not (is_standalone and key.endswith("for"))
+                    and not (not is_standalone and key.endswith("sta"))
+                }
+            
+            # Check alphabetic tokens against date dictionary (case-insensitive)
+            token_lower = token.lower()
+            for key, items in lowered_entries.items():
+                if token_lower in items:
                     token_options.append(key)
         
         elif token.isnumeric():
@@ -78,6 +132,47 @@ def analyze_tokens_for_format_options(tokens, date_dict, is_standalone=None):
     return formatting_options
 
 
+def _valid_section_combinations(section):
+    """
+    Enumerate a section's combinations that use each date element type at most once.
+    
+    Combinations are built slot by slot, and a branch is abandoned as soon as it
+    repeats an element type, so invalid combinations are never materialized.
+    Results come out in the same order as itertools.product.
+    
+    Args:
+        section (list): Option lists, one per token
+        
+    Returns:
+        list: Valid combinations (lists of format codes)
+    """
+    # Encode the date element type of each distinct option (e.g., 'mday'
+    # for 'mday_min_for') as one bit, so duplicate types are a mask test;
+    # options without a type (year, punctuation) never conflict
+    type_bits = {}
+    element_bits = {}
+    for format_list in section:
+        for option in format_list:
+            if '_' in option:
+                element_type = option.split('_')[0]
+                element_bits[option] = type_bits.setdefault(element_type, 1 << len(type_bits))
+    
+    valid_combinations = []
+    
+    def extend(index, used_mask, partial):
+        if index == len(section):
+            valid_combinations.append(partial)
+            return
+        for option in section[index]:
+            bit = element_bits.get(option, 0)
+            if used_mask & bit:
+                continue
+            extend(index + 1, used_mask | bit, partial + [option])
+    
+    extend(0, 0, [])
+    return valid_combinations
+
+
 def generate_valid_combinations(formatting_options):
     """
     Generate all valid date format combinations from token options.
@@ -97,38 +192,29 @@ def generate_valid_combinations(formatting_options):
         else:
             raise ValueError("Invalid format options.")
     else:
-        # Multi-token: group tokens by dash/period-separated sections
-        new_formatting_options = []
+        # Multi-token: group tokens by dash/period-separated sections, keeping
+        # the sections and the separators between them in separate lists
+        sections = []
+        separators = []
         current_group = []
         
         for format_list in formatting_options:
-            if format_list == ["-"] or format_list == ["."] or format_list == ["–"] or format_list == ["—"]:
+            if len(format_list) == 1 and format_list[0] in _SEPARATORS:
                 if current_group:
-                    new_formatting_options.append(current_group)
-                new_formatting_options.append(format_list[0])  # Add the separator
+                    sections.append(current_group)
+                separators.append(format_list[0])
                 current_group = []
             else:
                 current_group.append(format_list)
         
         if current_group:
-            new_formatting_options.append(current_group)
-        
-        # Extract sections (ignore separators for combination generation)
-        sections = [item for item in new_formatting_options if item not in ["-", ".", "–", "—"]]
+            sections.append(current_group)
         
         # Generate valid combinations for each section
         section_combinations = []
         for section in sections:
-            all_combinations = list(product(*section))
-            
-            # Filter out combinations with duplicate date element types
-            valid_combinations = []
-            for combo in all_combinations:
-                date_elements = [elem for elem in combo if isinstance(elem, str) and '_' in elem]
-                prefixes = [elem.split('_')[0] for elem in date_elements]
-                
-                if len(prefixes) == len(set(prefixes)):
-                    valid_combinations.append(list(combo))
+            # Combinations with duplicate date element types are pruned while building
+            valid_combinations = _valid_section_combinations(section)
             
             section_combinations.append(valid_combinations)
         
@@ -136,18 +222,12 @@ def generate_valid_combinations(formatting_options):
         if len(section_combinations) == 1:
             options = section_combinations[0]
         else:
-            all_section_products = list(product(*section_combinations))
-            for section_combo_tuple in all_section_products:
+            # Section i is preceded by the (i-1)-th separator, if there is one
+            for section_combo_tuple in product(*section_combinations):
                 combined = []
-                separator_index = 0
                 for i, section_combo in enumerate(section_combo_tuple):
-                    if i > 0:
-                        # Find the next separator in new_formatting_options
-                        while separator_index < len(new_formatting_options) and new_formatting_options[separator_index] not in ["-", ".", "–", "—"]:
-                            separator_index += 1
-                        if separator_index < len(new_formatting_options):
-                            combined.append(new_formatting_options[separator_index])
-                            separator_index += 1
+                    if 0 < i <= len(separators):
+                        combined.append(separators[i - 1])
                     combined.extend(section_combo)
                 options.append(combined)
     
@@ -164,14 +244,33 @@ def convert_to_skeleton_codes(options):
     Returns:
         list: List of skeleton code combinations
     """
+    # SKELETON_CODES is keyed by exactly the *_for/*_sta/"year" format codes, so a
+    # single lookup converts those and passes punctuation through unchanged
+    skeleton_code_for = SKELETON_CODES.get
     return [
-        [SKELETON_CODES[element] if isinstance(element, str) and
-         (element.endswith('_for') or element.endswith('_sta') or element == "year")
-         else element for element in option]
+        [skeleton_code_for(element, element) for element in option]
         for option in options
     ]
 
 
+def _has_content(element):
+    """Check if an element contains non-punctuation content."""
+    return bool(element.translate(_PUNCTUATION_STRIP).strip())
+
+
+def _classify_element(element):
+    """Return the (has_content, is_punctuation) flags used for spacing."""
+    return _has_content(element), element in PUNCTUATION
+
+
+# Spacing flags for every skeleton code and punctuation mark, classified once
+# so formatting looks each element up instead of re-scanning its characters
+_ELEMENT_FLAGS = {
+    element: _classify_element(element)
+    for element in list(SKELETON_CODES.values()) + PUNCTUATION
+}
+
+
 def format_skeleton_strings(options):
     """
     Convert skeleton combinations to properly spaced strings.
@@ -189,28 +288,30 @@ def format_skeleton_strings(options):
             string_options.append("")
             continue
         
-        result = str(option[0])
+        previous = str(option[0])
+        parts = [previous]
+        previous_flags = _ELEMENT_FLAGS.get(previous) or _classify_element(previous)
         
         for i in range(1, len(option)):
             current = str(option[i])
-            previous = str(option[i-1])
-            
-            # Check if element contains non-punctuation content
-            has_content = lambda x: x.replace(',', '').replace('/', '').replace('-', '').replace('–', '').replace('.', '').strip()
+            # Each element's flags are reused when it becomes `previous`
+            current_flags = _ELEMENT_FLAGS.get(current) or _classify_element(current)
+            current_has_content, current_is_punctuation = current_flags
             
             # Apply spacing rules
-            if previous == ',' and current not in PUNCTUATION:
+            if previous == ',' and not current_is_punctuation:
                 # Space after comma (unless followed by punctuation)
-                result += ' ' + current
-            elif (has_content(previous) and has_content(current) and
-                  previous not in PUNCTUATION and current not in PUNCTUATION):
+                parts.append(' ')
+            elif (previous_flags[0] and current_has_content and
+                  not previous_flags[1] and not current_is_punctuation):
                 # Space between date elements (both contain letters/numbers)
-                result += ' ' + current
-            else:
-                # No space for punctuation connections
-                result += current
+                parts.append(' ')
+            # Punctuation connections get no space before the element
+            parts.append(current)
+            
+            previous, previous_flags = current, current_flags
         
-        string_options.append(result)
+        string_options.append(''.join(parts))
     
     return string_options
 
@@ -229,22 +330,11 @@ def expand_dash_variations(string_options):
     
     for skeleton in string_options:
         if '-' in skeleton or '–' in skeleton:
-            # Normalize to hyphen-minus then create both dash variations
+            # Normalize to hyphen-minus then create the hyphen-minus and
+            # en-dash variations (which always differ, as a dash is present)
             base_skeleton = skeleton.replace('–', '-')
-            
-            # Create hyphen-minus and en-dash variations
-            variations = [
-                base_skeleton,                    # hyphen-minus
-                base_skeleton.replace('-', '–')   # en-dash
-            ]
-            
-            # Remove duplicates while preserving order
-            unique_variations = []
-            for var in variations:
-                if var not in unique_variations:
-                    unique_variations.append(var)
-            
-            expanded_options.extend(unique_variations)
+            expanded_options.append(base_skeleton)
+            expanded_options.append(base_skeleton.replace('-', '–'))
         else:
             # No dashes - add original skeleton as-is
             expanded_options.append(skeleton)
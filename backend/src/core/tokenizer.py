@@ -6,10 +6,43 @@ Handles both regex-based tokenization and semantic tokenization
 that recognizes multi-word date units from CLDR data.
 """
 
+import functools
+import re
 import regex
-from .constants import TOKEN_PATTERN, PUNCTUATION
+from .constants import TOKEN_PATTERN, PUNCTUATION, ATTACHED_PREFIX
 
+# Patterns compiled once at import instead of on every call. The regex module
+# is kept for Unicode properties and for \d/\s, whose classes differ from re's;
+# plain character classes use the faster stdlib engine
+_TOKEN_RE = regex.compile(TOKEN_PATTERN)
+# TOKEN_PATTERN restricted to ASCII input, where the Unicode property classes
+# reduce to plain ranges and the stdlib engine is faster
+_ASCII_TOKEN_RE = re.compile(r'[A-Za-z]+\.?|[0-9]+|[/,.\-]')
+_DASH_TABLE = str.maketrans({'—': '-', '−': '-', '–': '-'})
+_DASH_SPACING_RE = regex.compile(r'\s*-\s*')
+_PUNCTUATION_RE = re.compile(r'[/,\.\-–—،፣]')  # Includes Arabic comma ، and Amharic comma ፣
+_NUMBER_RE = regex.compile(r'\d+')
+_LETTER_RE = regex.compile(r'[\p{L}\p{M}]')  # Unicode letters and marks (accented and non-Latin scripts)
+_WORD_WITH_NUMBER_RE = regex.compile(r'[\p{L}\p{M}]+\d+[\p{L}\p{M}]*|\d+[\p{L}\p{M}]+')
+_COMPOUND_RE = regex.compile(r'\d+[^\s/,\.\-–—،፣]+')
+_WORD_RE = regex.compile(r'[\p{L}\p{M}]+\.?')  # Allows a period after the word
+# First non-whitespace character; the stdlib \S agrees with str.isspace()
+# on every code point, while the regex module treats \x1c-\x1f as non-space
+_NON_SPACE_RE = re.compile(r'\S')
+# Only digits, whitespace and punctuation: no date element or literal text possible
+_NUMERIC_EXPRESSION_RE = regex.compile(r'[\d\s/,\.\-–—،፣]*')
 
+
+def _is_letter(char):
+    """Check whether a character is a Unicode letter or mark (word boundary test)."""
+    # ASCII letters are exactly the ASCII characters matching _LETTER_RE, and
+    # str.isalpha() answers without entering the regex engine
+    if char.isascii():
+        return char.isalpha()
+    return _LETTER_RE.match(char) is not None
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_dashes(expression):
     """
     Normalize various dash/hyphen characters to standard forms.
@@ -20,14 +53,13 @@ def normalize_dashes(expression):
     Returns:
         str: Expression with normalized dashes
     """
-    # Normalize various dash types to standard forms
-    normalized = expression
-    # Convert em dash to en dash for consistency
-    normalized = normalized.replace('—', '-').replace('−', '-')
-    normalized = normalized.replace('–', '-')
-    normalized = regex.sub(r'\s*-\s*', '-', normalized)
-    normalized = normalized.replace('-', ' - ')
-    return normalized
+    # Convert em dash, minus sign and en dash to hyphen-minus in one pass
+    normalized = expression.translate(_DASH_TABLE)
+    if '-' not in normalized:
+        return normalized
+    # Surround every dash with exactly one space on each side
+    normalized = _DASH_SPACING_RE.sub('-', normalized)
+    return normalized.replace('-', ' - ')
 
 
 def tokenize_date_expression(expression):
@@ -42,7 +74,106 @@ def tokenize_date_expression(expression):
     """
     # Normalize dashes before tokenization
     normalized_expression = normalize_dashes(expression)
-    return regex.findall(TOKEN_PATTERN, normalized_expression)
+    if normalized_expression.isascii():
+        return _ASCII_TOKEN_RE.findall(normalized_expression)
+    return _TOKEN_RE.findall(normalized_expression)
+
+
+def _build_element_index(elements):
+    """
+    Index elements by their lowercased form for case-insensitive prefix matching.
+    
+    Args:
+        elements (list): Elements in priority order
+        
+    Returns:
+        tuple: (index, lengths) - lowercased form to its (priority, element) pairs,
+        and the sorted distinct lengths of the lowercased forms
+    """
+    index = {}
+    for priority, element in enumerate(elements):
+        index.setdefault(element.lower(), []).append((priority, element))
+    return index, sorted({len(lowered) for lowered in index})
+
+
+def _elements_at(text, lowered_text, start, end, element_index):
+    """
+    Find the indexed elements whose lowercased form starts at a position in text.
+    
+    Args:
+        text (str): Text to match in
+        lowered_text (str): text.lower() if its positions line up with text, else None
+        start (int): Position to match at
+        end (int): Position matches may not extend past
+        element_index (tuple): Index built by _build_element_index
+        
+    Returns:
+        list: Matching elements in priority order
+    """
+    if lowered_text is None:
+        # Lowercase just this span, as matching against the span's own lowercase
+        lowered_text = text[start:end].lower()
+        start, end = 0, len(lowered_text)
+    
+    index, lengths = element_index
+    matches = []
+    for length in lengths:
+        if start + length > end:
+            break
+        matches.extend(index.get(lowered_text[start:start + length], ()))
+    matches.sort()
+    return [element for _, element in matches]
+
+
+@functools.lru_cache(maxsize=128)
+def _prepare_date_elements(date_elements):
+    """
+    Build the date element structures used by semantic_tokenize.
+    
+    Args:
+        date_elements (tuple): All date dictionary values, in dictionary order
+        
+    Returns:
+        tuple: (unique_date_elements, element_index, multi_word_index) - the
+        deduplicated elements sorted by length (descending), their index from
+        _build_element_index, and the index of just the multi-word elements
+    """
+    # Remove duplicates (keeping first occurrences), then sort by length
+    # (descending) for longest-match tokenization; the sort is stable
+    unique_date_elements = sorted(dict.fromkeys(date_elements), key=len, reverse=True)
+
+    # All date elements are matched at a position with one lookup per distinct
+    # length, instead of comparing the position against every element. The
+    # multi-word subset (often empty) gets its own index for the first pass
+    multi_word_elements = [element for element in unique_date_elements if ' ' in element]
+    return (tuple(unique_date_elements), _build_element_index(unique_date_elements),
+            _build_element_index(multi_word_elements))
+
+
+@functools.lru_cache(maxsize=128)
+def _lowered_lexicon(lexicon):
+    """Return the set of lowercased lexicon words for case-insensitive lookup."""
+    return frozenset(word.lower() for word in lexicon)
+
+
+@functools.lru_cache(maxsize=128)
+def _lexicon_index(lexicon):
+    """Return the lexicon, longest words first, indexed by _build_element_index."""
+    return _build_element_index(sorted(lexicon, key=len, reverse=True))
+
+
+def _append_compound_parts(tokens, compound_parts):
+    """
+    Append the parts of a compound word, marking all but the first as attached.
+    
+    Args:
+        tokens (list): Token list to extend
+        compound_parts (list): (type, text) parts from break_down_compound_word
+    """
+    # First part is not attached to anything before; subsequent parts are
+    # attached to previous parts
+    tokens.append(compound_parts[0][1])
+    tokens.extend(ATTACHED_PREFIX + part_text for _, part_text in compound_parts[1:])
 
 
 def semantic_tokenize(expression, date_dict, lexicon):
@@ -63,106 +194,94 @@ def semantic_tokenize(expression, date_dict, lexicon):
     # Normalize dashes before processing
     expression = normalize_dashes(expression)
     
+    # Purely numeric expressions (e.g., "11/12/2021") cannot contain date
+    # elements or literal text, and split exactly like the plain regex tokenizer
+    if _NUMERIC_EXPRESSION_RE.fullmatch(expression):
+        return _TOKEN_RE.findall(expression)
+    
     # First, collect all possible date elements (including multi-word ones)
-    all_date_elements = []
-    for category_list in date_dict.values():
-        all_date_elements.extend(category_list)
+    date_elements = tuple(
+        element for category_list in date_dict.values() for element in category_list
+    )
+    # Repeated expressions (e.g., the same date across batch rows) reuse the
+    # cached tokens; the list copy keeps callers free to mutate the result
+    return list(_semantic_tokenize(expression, date_elements, tuple(lexicon)))
 
-    # Sort by length (descending) for longest-match tokenization
-    all_date_elements.sort(key=len, reverse=True)
 
-    # Remove duplicates while preserving order
-    unique_date_elements = []
-    for element in all_date_elements:
-        if element not in unique_date_elements:
-            unique_date_elements.append(element)
-
-    # Define patterns
-    punctuation_pattern = r'[/,\.\-–—،፣]'  # Added Arabic comma ، and Amharic comma ፣
-    number_pattern = r'\d+'
-    word_pattern = r'[\p{L}\p{M}]+'  # Match Unicode letters and marks (supports accented characters and non-Latin scripts)
+@functools.lru_cache(maxsize=4096)
+def _semantic_tokenize(expression, date_elements, lexicon):
+    """
+    Cached implementation of semantic_tokenize.
+    
+    Args:
+        expression (str): Dash-normalized date expression to tokenize
+        date_elements (tuple): All date dictionary values, in dictionary order
+        lexicon (tuple): Target language lexicon
+        
+    Returns:
+        tuple: Semantically meaningful tokens with attachment info
+    """
+    # The structures derived from the date elements are cached across calls
+    unique_date_elements, element_index, multi_word_index = _prepare_date_elements(date_elements)
 
     tokens = []
     i = 0
+    expression_length = len(expression)
+    # End of the text once trailing whitespace is ignored
+    content_end = len(expression.rstrip())
 
-    while i < len(expression):
-        # Skip whitespace
-        while i < len(expression) and expression[i].isspace():
-            i += 1
+    # Lowercase once for case-insensitive matching. The lowered copy only lines
+    # up with the expression when lowercasing keeps every length ('İ' grows) and
+    # ignores context (final sigma); otherwise each span is lowered separately
+    lowered_expression = expression.lower()
+    if len(lowered_expression) != expression_length or 'Σ' in expression:
+        lowered_expression = None
 
-        if i >= len(expression):
+    while i < expression_length:
+        # Skip whitespace
+        non_space = _NON_SPACE_RE.search(expression, i)
+        if non_space is None:
             break
+        i = non_space.start()
 
         # Check for punctuation (including Arabic and Amharic commas)
-        if regex.match(punctuation_pattern, expression[i]):
+        if _PUNCTUATION_RE.match(expression[i]):
             tokens.append(expression[i])
             i += 1
             continue
 
         # Check for words that contain numbers (like "Fi4", "2nd", etc.)
         # These should be treated as complete words and looked up in the lexicon
-        word_with_number_match = regex.match(r'[\p{L}\p{M}]+\d+[\p{L}\p{M}]*|\d+[\p{L}\p{M}]+', expression[i:])
+        word_with_number_match = _WORD_WITH_NUMBER_RE.match(expression, i)
         if word_with_number_match:
             word_with_number = word_with_number_match.group()
             
             # Check if this word exists in the lexicon or date elements
-            is_known_word = (word_with_number.lower() in [elem.lower() for elem in unique_date_elements] or
-                           word_with_number.lower() in [word.lower() for word in lexicon])
+            word_with_number_lower = word_with_number.lower()
+            is_known_word = (word_with_number_lower in element_index[0] or
+                             word_with_number_lower in _lowered_lexicon(lexicon))
             
             if is_known_word:
                 # This is a known word that happens to contain numbers - treat as single token
                 tokens.append(word_with_number)
                 i += len(word_with_number)
                 continue
-            else:
-                # Not a known word, might be a compound that needs breaking down
-                # Check if there's text immediately following the number (compound token)
-                number_match = regex.match(number_pattern, expression[i:])
-                if number_match:
-                    number = number_match.group()
-                    number_end = i + len(number)
-                    
-                    if (number_end < len(expression) and 
-                        regex.match(r'[\p{L}\p{M}]', expression[number_end]) and 
-                        not expression[number_end].isspace()):
-                        
-                        # This might be a compound token like "16de" - find the full word
-                        word_match = regex.match(r'\d+[^\s/,\.\-–—،፣]+', expression[i:])
-                        if word_match:
-                            compound_word = word_match.group()
-                            
-                            # Break down the compound word
-                            compound_parts = break_down_compound_word(compound_word, unique_date_elements)
-                            
-                            if len(compound_parts) > 1:
-                                # This is a compound token - add each part with attachment info
-                                for j, (part_type, part_text) in enumerate(compound_parts):
-                                    if j == 0:
-                                        # First part is not attached to anything before
-                                        tokens.append(part_text)
-                                    else:
-                                        # Subsequent parts are attached to previous parts
-                                        tokens.append(f"ATTACHED:{part_text}")
-                            else:
-                                # Not a compound, just add the number
-                                tokens.append(number)
-                            
-                            i += len(compound_word)
-                            continue
+            # Otherwise it may be a compound such as "16de", which the number
+            # check below breaks down
         
         # Check for pure numbers
-        number_match = regex.match(number_pattern, expression[i:])
+        number_match = _NUMBER_RE.match(expression, i)
         if number_match:
             number = number_match.group()
             number_end = i + len(number)
             
             # Check if there's text immediately following the number (compound token)
-            if (number_end < len(expression) and 
-                regex.match(r'[\p{L}\p{M}]', expression[number_end]) and 
+            if (number_end < expression_length and 
+                _is_letter(expression[number_end]) and 
                 not expression[number_end].isspace()):
                 
                 # This might be a compound token like "16de" - find the full word
-                word_match = regex.match(r'\d+[^\s/,\.\-–—،፣]+', expression[i:])
+                word_match = _COMPOUND_RE.match(expression, i)
                 if word_match:
                     compound_word = word_match.group()
                     
@@ -171,13 +290,7 @@ def semantic_tokenize(expression, date_dict, lexicon):
                     
                     if len(compound_parts) > 1:
                         # This is a compound token - add each part with attachment info
-                        for j, (part_type, part_text) in enumerate(compound_parts):
-                            if j == 0:
-                                # First part is not attached to anything before
-                                tokens.append(part_text)
-                            else:
-                                # Subsequent parts are attached to previous parts
-                                tokens.append(f"ATTACHED:{part_text}")
+                        _append_compound_parts(tokens, compound_parts)
                     else:
                         # Not a compound, just add the number
                         tokens.append(number)
@@ -192,49 +305,54 @@ def semantic_tokenize(expression, date_dict, lexicon):
 
         # Check for multi-word date elements first (longest match)
         found_multi_word = False
-        for date_element in unique_date_elements:
-            if ' ' in date_element:  # Multi-word elements
-                if expression[i:].lower().startswith(date_element.lower()):
-                    # Verify word boundaries
-                    start_pos = i
-                    end_pos = i + len(date_element)
-                    
-                    # Check start boundary
-                    if start_pos > 0 and regex.match(r'[\p{L}\p{M}]', expression[start_pos-1]):
-                        continue
-                    
-                    # Check end boundary
-                    if end_pos < len(expression) and regex.match(r'[\p{L}\p{M}]', expression[end_pos]):
-                        continue
-                    
-                    # Found valid multi-word date element
-                    tokens.append(expression[start_pos:end_pos])
-                    i = end_pos
-                    found_multi_word = True
-                    break
+        if multi_word_index[0]:
+            multi_word_here = _elements_at(
+                expression, lowered_expression, i, expression_length, multi_word_index
+            )
+        else:
+            multi_word_here = []
+        for date_element in multi_word_here:
+            # Verify word boundaries
+            start_pos = i
+            end_pos = i + len(date_element)
+            
+            # Check start boundary
+            if start_pos > 0 and _is_letter(expression[start_pos-1]):
+                continue
+            
+            # Check end boundary
+            if end_pos < expression_length and _is_letter(expression[end_pos]):
+                continue
+            
+            # Found valid multi-word date element
+            tokens.append(expression[start_pos:end_pos])
+            i = end_pos
+            found_multi_word = True
+            break
         
         if found_multi_word:
             continue
 
         # Check for complete multi-word expressions that might contain Unicode characters
         # Look ahead to find complete words/phrases that match the lexicon
-        remaining_text = expression[i:].strip()
-        if remaining_text:
-            # Try to match the longest possible phrase from the lexicon
-            longest_match = None
+        if content_end > i:
+            # Try to match the longest possible phrase from the lexicon; only the
+            # words the remaining text starts with are considered, longest first
             longest_length = 0
             
-            for lexicon_word in lexicon:
-                if len(lexicon_word) > longest_length and remaining_text.lower().startswith(lexicon_word.lower()):
-                    # Check if it's a complete word/phrase (ends at word boundary)
-                    match_end = i + len(lexicon_word)
-                    if (match_end >= len(expression) or 
-                        expression[match_end].isspace() or 
-                        expression[match_end] in PUNCTUATION):
-                        longest_match = lexicon_word
-                        longest_length = len(lexicon_word)
+            lexicon_words_here = _elements_at(
+                expression, lowered_expression, i, content_end, _lexicon_index(lexicon)
+            )
+            for lexicon_word in lexicon_words_here:
+                # Check if it's a complete word/phrase (ends at word boundary)
+                match_end = i + len(lexicon_word)
+                if (match_end >= expression_length or 
+                    expression[match_end].isspace() or 
+                    expression[match_end] in PUNCTUATION):
+                    longest_length = len(lexicon_word)
+                    break
             
-            if longest_match:
+            if longest_length:
                 tokens.append(expression[i:i+longest_length])
                 i += longest_length
                 continue
@@ -243,33 +361,22 @@ def semantic_tokenize(expression, date_dict, lexicon):
             continue
 
         # Check for single words (including abbreviated forms with periods)
-        word_match = regex.match(r'[\p{L}\p{M}]+\.?', expression[i:])  # Allow periods after words, supports Unicode
+        word_match = _WORD_RE.match(expression, i)
         if word_match:
             word = word_match.group()
             
             # Check if this word (with or without period) is a date element
-            is_date_element = False
-            for date_element in unique_date_elements:
-                if word.lower() == date_element.lower():
-                    # Found valid date element match
-                    tokens.append(word)
-                    i += len(word)
-                    is_date_element = True
-                    break
-            
-            if not is_date_element:
+            if word.lower() in element_index[0]:
+                # Found valid date element match
+                tokens.append(word)
+                i += len(word)
+            else:
                 # Not a date element - try to break down compound words
                 compound_parts = break_down_compound_word(word, unique_date_elements)
                 
                 if len(compound_parts) > 1:
                     # This is a compound token - add each part with attachment info
-                    for j, (part_type, part_text) in enumerate(compound_parts):
-                        if j == 0:
-                            # First part is not attached to anything before
-                            tokens.append(part_text)
-                        else:
-                            # Subsequent parts are attached to previous parts
-                            tokens.append(f"ATTACHED:{part_text}")
+                    _append_compound_parts(tokens, compound_parts)
                 else:
                     # Single word - add it as a literal token
                     tokens.append(word)
@@ -280,38 +387,54 @@ def semantic_tokenize(expression, date_dict, lexicon):
         # Check for date elements (longest match first) - for cases where date elements
         # might be embedded in compound words or have special formatting
         found_match = False
-        for date_element in unique_date_elements:
-            if expression[i:].lower().startswith(date_element.lower()):
-                # Verify word boundaries (don't match partial words at start/end)
-                start_pos = i
-                end_pos = i + len(date_element)
-
-                # Check start boundary
-                if start_pos > 0 and regex.match(r'[\p{L}\p{M}]', expression[start_pos-1]):
-                    continue
+        elements_here = _elements_at(
+            expression, lowered_expression, i, expression_length, element_index
+        )
+        for date_element in elements_here:
+            # Verify word boundaries (don't match partial words at start/end)
+            start_pos = i
+            end_pos = i + len(date_element)
 
-                # Note: We intentionally allow a following letter so that
-                # shorter forms can match inside longer words when no longer
-                # form exists in the input (e.g., 'oct' in 'octre').
+            # Check start boundary
+            if start_pos > 0 and _is_letter(expression[start_pos-1]):
+                continue
 
-                # Found valid date element match
-                tokens.append(expression[start_pos:end_pos])
-                i = end_pos
-                found_match = True
-                break
+            # Note: We intentionally allow a following letter so that
+            # shorter forms can match inside longer words when no longer
+            # form exists in the input (e.g., 'oct' in 'octre').
+
+            # Found valid date element match
+            tokens.append(expression[start_pos:end_pos])
+            i = end_pos
+            found_match = True
+            break
 
         if not found_match:
-            # Check for any remaining non-whitespace characters as literal
-            remaining_chars = expression[i:].strip()
-            if remaining_chars:
-                # Take the first non-whitespace character as literal
-                tokens.append(expression[i])
-                i += 1
-            else:
-                # Skip any remaining whitespace
-                i += 1
+            # Whitespace was skipped above, so the character at i is the first
+            # non-whitespace character; take it as literal
+            tokens.append(expression[i])
+            i += 1
 
-    return tokens
+    return tuple(tokens)
+
+
+@functools.lru_cache(maxsize=128)
+def _elements_by_length(date_elements):
+    """
+    Group lowercased date elements by their length.
+    
+    Args:
+        date_elements (tuple): Known date elements
+        
+    Returns:
+        tuple: (length, frozenset of lowercased elements) pairs, longest first
+    """
+    buckets = {}
+    for date_element in date_elements:
+        buckets.setdefault(len(date_element), set()).add(date_element.lower())
+    return tuple(
+        (length, frozenset(buckets[length])) for length in sorted(buckets, reverse=True)
+    )
 
 
 def break_down_compound_word(word, date_elements):
@@ -329,32 +452,35 @@ def break_down_compound_word(word, date_elements):
     parts = []
     i = 0
     
+    # Lowercased date elements bucketed by length (longest first), so each
+    # offset is tested with one set lookup per length instead of per element
+    elements_by_length = _elements_by_length(tuple(date_elements))
+    
     while i < len(word):
         found_match = False
         
         # Check for numbers first
-        number_match = regex.match(r'\d+', word[i:])
+        number_match = _NUMBER_RE.match(word, i)
         if number_match:
             parts.append(('number', number_match.group()))
             i += len(number_match.group())
             found_match = True
             continue
         
-        # Check for date elements (longest match first - date_elements already sorted)
-        for date_element in date_elements:
+        # Check for date elements (longest match first)
+        for length, elements in elements_by_length:
             # Skip single-character matches when we're in the middle of a word
             # (single chars should only match as standalone tokens)
-            if len(date_element) == 1 and len(word) > 1:
+            if length == 1 and len(word) > 1:
                 continue
                 
-            # Check if this date element matches at current position
-            if (i + len(date_element) <= len(word) and 
-                word[i:i+len(date_element)].lower() == date_element.lower()):
+            # Check if a date element of this length matches at current position
+            if i + length <= len(word) and word[i:i+length].lower() in elements:
                 # Accept matches even if a letter follows. Longest-match-first
                 # ensures the widest form wins; if not present, shorter forms
                 # like 'oct' can still match in 'octre'.
-                parts.append(('date', word[i:i+len(date_element)]))
-                i += len(date_element)
+                parts.append(('date', word[i:i+length]))
+                i += length
                 found_match = True
                 break
         
@@ -366,24 +492,20 @@ def break_down_compound_word(word, date_elements):
             next_match_pos = len(word)  # Default to end of word
             
             # Check for numbers ahead
-            for j in range(i + 1, len(word) + 1):
-                number_match = regex.match(r'\d+', word[j:])
-                if number_match:
-                    next_match_pos = j
-                    break
+            number_match = _NUMBER_RE.search(word, i + 1)
+            if number_match:
+                next_match_pos = number_match.start()
             
-            # Check for date elements ahead (multi-character only in compound words)
-            for j in range(i + 1, len(word) + 1):
-                for date_element in date_elements:
-                    # Skip single-character date elements in compound words
-                    if len(date_element) == 1:
-                        continue
-                        
-                    if (j + len(date_element) <= len(word) and 
-                        word[j:j+len(date_element)].lower() == date_element.lower()):
-                        next_match_pos = min(next_match_pos, j)
-                        break
-                if next_match_pos < len(word):
+            # Check for date elements ahead (multi-character only in compound words);
+            # with a number ahead only the offset right after i is examined
+            last_offset = i + 1 if number_match else len(word)
+            for j in range(i + 1, last_offset + 1):
+                if any(
+                    word[j:j+length].lower() in elements
+                    for length, elements in elements_by_length
+                    if length > 1 and j + length <= len(word)
+                ):
+                    next_match_pos = min(next_match_pos, j)
                     break
             
             # Extract literal text up to the next match
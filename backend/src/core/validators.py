@@ -8,6 +8,16 @@ validating numeric values against date constraints, and checking tokens against
 
 from .constants import ENGLISH_LEXICON, PUNCTUATION
 
+# Hashed forms of the constant lists used for per-token membership tests
+_PUNCTUATION_SET = frozenset(PUNCTUATION)
+_ENGLISH_LEXICON_LOWER = frozenset(item.lower() for item in ENGLISH_LEXICON)
+
+# Punctuation allowed at the end of an expression (e.g., abbreviations)
+_END_ALLOWED_PUNCTUATION = frozenset((".", "'", "’"))
+# Skeleton codes whose numeric values are bounds-checked
+_MONTH_CODES = frozenset(("MM", "M"))
+_DAY_CODES = frozenset(("dd", "d"))
+
 
 def validate_tokens(tokens, expression_name="expression"):
     """
@@ -31,14 +41,13 @@ def validate_tokens(tokens, expression_name="expression"):
             if len(token) > 4 or len(token) == 3:
                 raise ValueError(f"'{token}' is not a valid element. Please rerun {expression_name} before continuing.")
 
-        elif token in PUNCTUATION:
-            end_allowed = {".", "'", "’"}
+        elif token in _PUNCTUATION_SET:
             # Punctuation cannot be at start or consecutive; allow certain punctuation at end (e.g., abbreviations)
             if i == 0:
                 raise ValueError(f"'{' '.join(tokens)}' is not a valid expression. Please rerun {expression_name} before continuing.")
-            if i == len(tokens) - 1 and token not in end_allowed:
+            if i == len(tokens) - 1 and token not in _END_ALLOWED_PUNCTUATION:
                 raise ValueError(f"'{' '.join(tokens)}' is not a valid expression. Please rerun {expression_name} before continuing.")
-            if i > 0 and tokens[i-1] in PUNCTUATION:
+            if i > 0 and tokens[i-1] in _PUNCTUATION_SET:
                 raise ValueError(f"'{' '.join(tokens)}' has consecutive punctuation. Please rerun {expression_name} before continuing.")
 
 
@@ -55,8 +64,8 @@ def validate_english_tokens(tokens, expression):
     """
     for token in tokens:
         if (not token.isnumeric() and 
-            token not in PUNCTUATION and 
-            token.lower() not in [item.lower() for item in ENGLISH_LEXICON]):
+            token not in _PUNCTUATION_SET and 
+            token.lower() not in _ENGLISH_LEXICON_LOWER):
             raise ValueError(f"'{token}' is not in the English data set.")
 
 
@@ -72,10 +81,12 @@ def validate_target_language_tokens(tokens, lexicon, expression):
     Raises:
         ValueError: If token not in target language lexicon
     """
+    # Built once per call rather than scanning the lexicon list for every token
+    lexicon_set = set(lexicon)
     for token in tokens:
         if (not token.isnumeric() and 
-            token not in PUNCTUATION and 
-            token not in lexicon):
+            token not in _PUNCTUATION_SET and 
+            token not in lexicon_set):
             raise ValueError(f"'{token}' is not in the target language data set.")
 
 
@@ -91,17 +102,15 @@ def validate_date_values(tokens, skeleton_tokens):
     Raises:
         ValueError: If date values are out of bounds
     """
-    for i in range(min(len(tokens), len(skeleton_tokens))):
-        token = skeleton_tokens[i]
-        input_value = tokens[i]
-
+    # zip stops at the shorter sequence, pairing each input with its skeleton token
+    for input_value, token in zip(tokens, skeleton_tokens):
         # Check month bounds (1-12)
-        if token in ["MM", "M"] and input_value.isdigit():
+        if token in _MONTH_CODES and input_value.isdigit():
             if int(input_value) > 12:
                 raise ValueError(f"'{input_value}' is out of bounds for month of the year. Please rerun and enter a different string.")
 
         # Check day bounds (1-31)
-        elif token in ["dd", "d"] and input_value.isdigit():
+        elif token in _DAY_CODES and input_value.isdigit():
             if int(input_value) > 31:
                 raise ValueError(f"'{input_value}' is out of bounds for day of the month. Please rerun and enter a different string.")
 
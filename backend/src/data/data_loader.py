@@ -6,10 +6,30 @@ Handles loading and processing of CLDR data from Excel files,
 populating target language dictionaries and lexicons.
 """
 
+import functools
 import os
 import pandas as pd
 
 
+@functools.lru_cache(maxsize=32)
+def _read_excel_cached(file_path, modified_time):
+    """Parse an Excel file; the modification time keys out stale entries."""
+    return pd.read_excel(file_path, engine='openpyxl')
+
+
+def _read_excel(file_path):
+    """
+    Read an Excel file, reusing the parsed data while the file is unchanged.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        pandas.DataFrame: A copy of the parsed data, safe for callers to modify
+    """
+    return _read_excel_cached(file_path, os.path.getmtime(file_path)).copy()
+
+
 def load_english_reference_data(base_path):
     """
     Load English reference data from Excel file.
@@ -30,7 +50,7 @@ def load_english_reference_data(base_path):
         raise FileNotFoundError(f"English reference file not found at: {file_path}")
     
     print(f"Loading English reference data from: {file_path}")
-    df = pd.read_excel(file_path, engine='openpyxl')
+    df = _read_excel(file_path)
     
     # Clean thin space characters from the data
     english_possibilities = df['English'].values.tolist()
@@ -65,7 +85,7 @@ def load_target_language_data(base_path, lang_code):
     
     if os.path.exists(file_path):
         print(f"Loading {lang_code.capitalize()} data from: {file_path}")
-        return pd.read_excel(file_path, engine='openpyxl')
+        return _read_excel(file_path)
     
     # If exact match fails, search for files that start with the language name
     search_pattern = os.path.join(base_path, f"{lang_code}*_moderate.xlsx")
@@ -76,7 +96,7 @@ def load_target_language_data(base_path, lang_code):
         actual_lang = os.path.basename(file_path).split('_')[0]
         print(f"Found matching file for '{lang_code}': {actual_lang}")
         print(f"Loading {actual_lang.capitalize()} data from: {file_path}")
-        return pd.read_excel(file_path, engine='openpyxl')
+        return _read_excel(file_path)
     
     # If still no match, list available languages to help the user
     all_files = glob.glob(os.path.join(base_path, "*_moderate.xlsx"))
@@ -122,6 +142,26 @@ def populate_target_language_dict(tlang_df):
     wday_lengths = ["short", "narrow", "wide", "abbreviated"]
     elem_contexts = ["Formatting", "Standalone"]
     
+    # The translation column depends only on the sheet layout, not on the row subset
+    column_name = "Translation" if "Translation" in tlang_df.columns else "Winning"
+    
+    # Only the month/day headers are read below, so restrict the sheet to them
+    # before grouping instead of building a group for every header
+    date_headers = [
+        f"{elem_type} - {length} - {elem_context}"
+        for elem_type in elem_types
+        for length in (mon_lengths if elem_type == "Months" else wday_lengths)
+        for elem_context in elem_contexts
+    ]
+    date_rows = tlang_df[tlang_df['Header'].isin(date_headers)]
+    
+    # Group the translations by header in one pass instead of scanning the
+    # whole sheet once per element/length/context combination
+    translations_by_header = {
+        header: rows[column_name].dropna().tolist()  # Remove NaN values
+        for header, rows in date_rows.groupby('Header', sort=False)
+    }
+    
     # Populate date dictionary and lexicon from target language data
     for elem_type in elem_types:
         # Select appropriate length options for current element type
@@ -131,19 +171,15 @@ def populate_target_language_dict(tlang_df):
             for length in lengths:
                 # Find matching translations in the dataset
                 date_structure = f"{elem_type} - {length} - {elem_context}"
-                matching_rows = tlang_df[tlang_df['Header'] == date_structure]
-                column_name = "Translation" if "Translation" in matching_rows.columns else "Winning"
-                translations = matching_rows[column_name].dropna().tolist()  # Remove NaN values
+                translations = translations_by_header.get(date_structure, [])
                 
                 # Limit to expected number of items (12 months, 7 days)
                 max_items = 12 if elem_type == "Months" else 7
                 translations = translations[:max_items]
                 
-                # Add to lexicon and dictionary
-                lexicon.extend(translations)
-                
-                # Also add lowercase versions for case-insensitive matching
-                lexicon.extend([val.lower() for val in translations if isinstance(val, str)])
+                # Add to lexicon and dictionary, along with lowercase versions
+                # for case-insensitive matching
+                lexicon.extend(translations + [val.lower() for val in translations if isinstance(val, str)])
                 
                 # Generate dictionary key (e.g., "mon_nar_for", "day_wid_sta")
                 date_dict_key = f"{elem_type.lower()[:3]}_{length[:3]}_{elem_context.lower()[:3]}"
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for mapping English skeletons to target language skeletons
+
+Pins the target skeletons produced for numeric dates with repeated values,
+zero-padded targets, short-year inference, ranges and literal text.
+"""
+
+import sys
+import os
+import io
+import contextlib
+import unittest
+
+# Add the src directory to the Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.tokenizer import tokenize_date_expression, semantic_tokenize
+from core.cross_language_mapper import map_english_to_target_skeleton
+
+
+# Minimal Spanish date dictionary covering the expressions below
+SPANISH_DATE_DICT = {
+    "mon_nar_for": ["E", "F", "M", "A", "M", "J", "J", "A", "S", "O", "N", "D"],
+    "mon_wid_for": ["enero", "febrero", "marzo", "abril", "mayo", "junio",
+                    "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"],
+    "mon_abb_for": ["ene", "feb", "mar", "abr", "may", "jun",
+                    "jul", "ago", "sept", "oct", "nov", "dic"],
+    "day_wid_for": ["domingo", "lunes", "martes", "miércoles", "jueves", "viernes", "sábado"],
+    "day_abb_for": ["dom", "lun", "mar", "mié", "jue", "vie", "sáb"],
+}
+SPANISH_LEXICON = [value for values in SPANISH_DATE_DICT.values() for value in values]
+
+
+def map_skeleton(english_expression, english_skeleton, target_expression):
+    """Map an English expression and skeleton to target skeletons, quietly."""
+    target_tokens = semantic_tokenize(target_expression, SPANISH_DATE_DICT, SPANISH_LEXICON)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return map_english_to_target_skeleton(
+            tokenize_date_expression(english_expression), english_skeleton,
+            target_tokens, SPANISH_DATE_DICT, [], target_expression
+        )
+
+
+class TestNumericMapping(unittest.TestCase):
+    """Test the numeric-only mapping path."""
+    
+    def test_day_equals_month(self):
+        """Test that equal day and month values allow both orders."""
+        self.assertEqual(map_skeleton("1/1/2024", "M/d/y", "1/1/2024"), ['M/d/y', 'd/M/y'])
+    
+    def test_swapped_day_and_month(self):
+        """Test that distinct values fix the target order."""
+        self.assertEqual(map_skeleton("1/2/2024", "M/d/y", "2/1/2024"), ['d/M/y'])
+    
+    def test_zero_padded_target(self):
+        """Test that zero-padded target values map to two-letter codes."""
+        self.assertEqual(map_skeleton("1/2/2024", "M/d/y", "02/01/2024"), ['dd/MM/y'])
+    
+    def test_short_year_to_full_year(self):
+        """Test that an English short year maps to a full target year."""
+        self.assertEqual(map_skeleton("1/2/24", "M/d/yy", "2/1/2024"), ['d/M/y'])
+    
+    def test_all_values_repeated(self):
+        """Test the assignments when day, month and short year share a value."""
+        expected = [
+            'M/d/y', 'M/dd/y', 'M/yy/y', 'MM/d/y', 'MM/dd/y', 'MM/yy/y',
+            'd/M/y', 'd/MM/y', 'd/yy/y', 'dd/M/y', 'dd/MM/y', 'dd/yy/y',
+            'yy/M/y', 'yy/MM/y', 'yy/d/y', 'yy/dd/y',
+        ]
+        self.assertEqual(map_skeleton("12/12/12", "M/d/yy", "12/12/2012"), expected)
+    
+    def test_range(self):
+        """Test that both sides of a numeric range are mapped consistently."""
+        self.assertEqual(map_skeleton("3/4 - 3/9", "M/d - M/d", "04/03 - 09/03"), ['dd/MM - dd/MM'])
+    
+    def test_unmatched_values(self):
+        """Test that target values missing from the English expression are rejected."""
+        with self.assertRaises(ValueError):
+            map_skeleton("1/2/2024", "M/d/y", "13/1/2024")
+
+
+class TestElementMapping(unittest.TestCase):
+    """Test mapping with month and day names and literal text."""
+    
+    def test_literal_text(self):
+        """Test that unrecognized words are kept as quoted literals."""
+        expected = ["d 'de' MMMM 'de' y", "dd 'de' MMMM 'de' y"]
+        self.assertEqual(map_skeleton("January 16, 2006", "MMMM d, y", "16 de enero de 2006"), expected)
+    
+    def test_weekday(self):
+        """Test a full date with a weekday name."""
+        expected = ["EEEE, d 'de' MMMM 'de' y", "EEEE, dd 'de' MMMM 'de' y"]
+        self.assertEqual(
+            map_skeleton("Tuesday, January 16, 2006", "EEEE, MMMM d, y", "martes, 16 de enero de 2006"),
+            expected
+        )
+    
+    def test_repeated_call_output(self):
+        """Test that a repeated mapping returns and prints the same output."""
+        english_tokens = tokenize_date_expression("January 16, 2006")
+        target_tokens = semantic_tokenize("16 de enero de 2006", SPANISH_DATE_DICT, SPANISH_LEXICON)
+        outputs = []
+        for _ in range(2):
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                result = map_english_to_target_skeleton(
+                    english_tokens, "MMMM d, y", target_tokens, SPANISH_DATE_DICT, [], "16 de enero de 2006"
+                )
+            outputs.append((result, buffer.getvalue()))
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn("Final target skeleton strings", outputs[1][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
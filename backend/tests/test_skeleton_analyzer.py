@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for skeleton combination generation and formatting
+
+Pins the English skeleton options produced for ambiguous numeric dates,
+ranges and full dates, so changes to the combination search keep its output.
+"""
+
+import sys
+import os
+import unittest
+
+# Add the src directory to the Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.constants import ENGLISH_DATE_DICT
+from core.tokenizer import tokenize_date_expression
+from core.skeleton_analyzer import (
+    analyze_tokens_for_format_options, generate_valid_combinations,
+    convert_to_skeleton_codes, format_skeleton_strings
+)
+
+
+def english_skeleton_strings(expression):
+    """Run an English expression through the skeleton pipeline."""
+    tokens = tokenize_date_expression(expression)
+    formatting_options = analyze_tokens_for_format_options(tokens, ENGLISH_DATE_DICT)
+    options = generate_valid_combinations(formatting_options)
+    return format_skeleton_strings(convert_to_skeleton_codes(options))
+
+
+class TestGenerateValidCombinations(unittest.TestCase):
+    """Test combination generation for English expressions."""
+    
+    def test_ambiguous_numeric_date(self):
+        """Test that day and month may swap in a numeric date."""
+        tokens = tokenize_date_expression("1/2/2024")
+        formatting_options = analyze_tokens_for_format_options(tokens, ENGLISH_DATE_DICT)
+        expected = [
+            ['mday_min_for', '/', 'mon_min_for', '/', 'year'],
+            ['mon_min_for', '/', 'mday_min_for', '/', 'year'],
+        ]
+        self.assertEqual(generate_valid_combinations(formatting_options), expected)
+    
+    def test_fully_ambiguous_numeric_date(self):
+        """Test that every order of day, month and short year is produced."""
+        expected = [
+            'd/M/yy', 'd/MM/yy', 'd/yy/M', 'd/yy/MM',
+            'dd/M/yy', 'dd/MM/yy', 'dd/yy/M', 'dd/yy/MM',
+            'M/d/yy', 'M/dd/yy', 'M/yy/d', 'M/yy/dd',
+            'MM/d/yy', 'MM/dd/yy', 'MM/yy/d', 'MM/yy/dd',
+            'yy/d/M', 'yy/d/MM', 'yy/dd/M', 'yy/dd/MM',
+            'yy/M/d', 'yy/M/dd', 'yy/MM/d', 'yy/MM/dd',
+        ]
+        self.assertEqual(english_skeleton_strings("12/11/10"), expected)
+    
+    def test_range(self):
+        """Test that each side of a range is combined separately."""
+        tokens = tokenize_date_expression("Jan 5 – 7, 2024")
+        formatting_options = analyze_tokens_for_format_options(tokens, ENGLISH_DATE_DICT)
+        expected = [
+            ['mon_abb_for', 'mday_min_for', '-', 'mday_min_for', ',', 'year'],
+            ['mon_abb_for', 'mday_min_for', '-', 'mon_min_for', ',', 'year'],
+        ]
+        self.assertEqual(generate_valid_combinations(formatting_options), expected)
+        self.assertEqual(english_skeleton_strings("Jan 5 – 7, 2024"), ['MMM d-d, y', 'MMM d-M, y'])
+    
+    def test_weekday_month_day_year(self):
+        """Test a full date with weekday, month, day and year."""
+        expected = ['EEEE, MMMM d, y', 'EEEE, MMMM dd, y', 'EEEE, MMMM yy, y']
+        self.assertEqual(english_skeleton_strings("Tuesday, January 16, 2006"), expected)
+    
+    def test_single_invalid_token(self):
+        """Test that a lone token without skeleton codes is rejected."""
+        with self.assertRaises(ValueError):
+            generate_valid_combinations([[',']])
+
+
+class TestFormatSkeletonStrings(unittest.TestCase):
+    """Test spacing of formatted skeleton strings."""
+    
+    def test_spacing(self):
+        """Test spacing after commas and between date elements."""
+        options = [['MMMM', 'd', ',', 'y'], ['d', '/', 'M', '/', 'y'], ['MMM', 'd', '-', 'd'], []]
+        expected = ['MMMM d, y', 'd/M/y', 'MMM d-d', '']
+        self.assertEqual(format_skeleton_strings(options), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()